@@ -11,6 +11,7 @@ class ParseRuleRequest(BaseModel):
     scope: ParseScope = ParseScope.ALL_TEXT
     strategy: ParseStrategy = ParseStrategy.FIRST_MATCH
     fallback_value: Optional[str] = None
+    secondary_pattern: Optional[str] = None
 
     @validator('name', 'pattern')
     def validate_non_empty(cls, v):
@@ -38,4 +39,33 @@ class ParseRequest(BaseModel):
                 ],
                 "require_all_rules": True
             }
-        }
\ No newline at end of file
+        }
+
+
+class BulkParseRequest(BaseModel):
+    texts: List[str] = Field(..., min_items=1)
+    rules: List[ParseRuleRequest] = Field(..., min_items=1)
+    require_all_rules: bool = True
+
+    @validator('texts', each_item=True)
+    def validate_text(cls, v):
+        if not v.strip():
+            raise ValueError("Texts cannot be empty or only whitespace")
+        return v
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "texts": ["First output to parse", "Second output to parse"],
+                "rules": [
+                    {
+                        "name": "sample_rule",
+                        "pattern": r"\w+",
+                        "mode": "regex",
+                        "scope": "all_text",
+                        "strategy": "first_match"
+                    }
+                ],
+                "require_all_rules": True
+            }
+        }
@@ -2,7 +2,15 @@
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 from pydantic import BaseModel, Field, validator
-from ....domain.model.entities.verification import VerificationMethodType, VerificationMode
+from ....domain.model.entities.verification import VerificationMethodType, VerificationMode, ConsensusMode, VerificationExecutionMode
+
+class CascadeConfigRequest(BaseModel):
+    positive_exemplars: List[str] = []
+    negative_exemplars: List[str] = []
+    weights: Optional[List[float]] = None
+    bias: float = 0.0
+    accept_above: float = Field(0.8, ge=0, le=1)
+    reject_below: float = Field(0.2, ge=0, le=1)
 
 class VerificationMethodRequest(BaseModel):
     name: str = Field(..., min_length=1)
@@ -11,12 +19,16 @@ class VerificationMethodRequest(BaseModel):
     thresholds: Optional[Dict[str, float]] = None
     reference_text: Optional[str] = None
     required_matches: Optional[int] = None
+    consensus_mode: ConsensusMode = ConsensusMode.SAMPLING
+    cascade: Optional[CascadeConfigRequest] = None
 
 class VerifyTextRequest(BaseModel):
     text: str = Field(..., min_length=1)
     methods: List[VerificationMethodRequest] = Field(..., min_items=1)
     required_for_confirmed: int = Field(..., gt=0)
     required_for_review: int = Field(..., ge=0)
+    execution_mode: VerificationExecutionMode = VerificationExecutionMode.SEQUENTIAL
+    timeout: Optional[float] = Field(None, gt=0)
     context: Optional[Dict[str, any]] = None
 
     @validator('required_for_confirmed')
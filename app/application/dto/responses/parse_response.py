@@ -1,5 +1,5 @@
 # application/dto/responses/parse_response.py
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 from ....domain.model.value_objects.parse_result import ParseMatch, ParseMetrics
@@ -8,6 +8,8 @@ class ParseLocationResponse(BaseModel):
     start: int
     end: int
     line_number: Optional[int] = None
+    absolute_start: Optional[int] = None
+    absolute_end: Optional[int] = None
 
 class ParseMatchResponse(BaseModel):
     value: str
@@ -20,6 +22,7 @@ class ParseMetricsResponse(BaseModel):
     execution_time: float
     chars_processed: int
     rules_matched: List[str]
+    rule_timings: Dict[str, float] = Field(default_factory=dict)
 
 class ParseResponse(BaseModel):
     parse_result: List[ParseMatchResponse]
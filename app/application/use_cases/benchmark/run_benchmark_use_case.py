@@ -3,6 +3,7 @@ from typing import List, Optional
 from datetime import datetime
 from dataclasses import dataclass
 from ....domain.model.entities.benchmark import BenchmarkConfiguration, BenchmarkEntry, BenchmarkExecution
+from ....domain.model.entities.verification import VerificationSummary
 from ....domain.services.metrics_service import MetricsService
 from ....domain.services.verifier_service import VerifierService
 from ....domain.ports.logger_port import LoggerPort
@@ -48,29 +49,20 @@ class RunBenchmarkUseCase:
         successful_entries = 0
         failed_entries = 0
 
-        for entry in request.entries:
-            try:
-                verification_summary = self.verifier_service.verify_text(
-                    text=entry.input_text,
-                    methods=request.configuration.verification_methods,
-                    required_for_confirmed=request.configuration.required_success_rate,
-                    required_for_review=request.configuration.max_verification_time
-                )
-                
-                if verification_summary.final_status == entry.expected_status:
-                    successful_entries += 1
-                else:
-                    failed_entries += 1
-                
-                verification_results.append(verification_summary)
-                
-            except Exception as e:
+        for entry, verification_summary in zip(
+            request.entries,
+            self._verify_entries(request, execution_id)
+        ):
+            if verification_summary is None:
                 failed_entries += 1
-                self.logger.log(
-                    level="ERROR",
-                    message=f"Error processing benchmark entry: {str(e)}",
-                    context={"execution_id": execution_id, "entry_id": id(entry)}
-                )
+                continue
+
+            if verification_summary.final_status == entry.expected_status:
+                successful_entries += 1
+            else:
+                failed_entries += 1
+
+            verification_results.append(verification_summary)
 
         end_time = datetime.now()
         execution_time = (end_time - start_time).total_seconds()
@@ -101,6 +93,48 @@ class RunBenchmarkUseCase:
             execution_time=execution_time
         )
 
+    def _verify_entries(
+        self,
+        request: RunBenchmarkRequest,
+        execution_id: str
+    ) -> List[Optional[VerificationSummary]]:
+        configuration = request.configuration
+        try:
+            # All entries go through each verification method together
+            # max_verification_time is per entry; batched entries share one budget
+            return self.verifier_service.verify_texts(
+                texts=[entry.input_text for entry in request.entries],
+                methods=configuration.verification_methods,
+                required_for_confirmed=configuration.required_success_rate,
+                required_for_review=configuration.max_verification_time,
+                timeout=configuration.max_verification_time * len(request.entries)
+            )
+        except Exception as e:
+            self.logger.log(
+                level="WARNING",
+                message=f"Batch verification failed, verifying entries one by one: {str(e)}",
+                context={"execution_id": execution_id}
+            )
+
+        summaries: List[Optional[VerificationSummary]] = []
+        for entry in request.entries:
+            try:
+                summaries.append(self.verifier_service.verify_text(
+                    text=entry.input_text,
+                    methods=configuration.verification_methods,
+                    required_for_confirmed=configuration.required_success_rate,
+                    required_for_review=configuration.max_verification_time,
+                    timeout=configuration.max_verification_time
+                ))
+            except Exception as e:
+                summaries.append(None)
+                self.logger.log(
+                    level="ERROR",
+                    message=f"Error processing benchmark entry: {str(e)}",
+                    context={"execution_id": execution_id, "entry_id": id(entry)}
+                )
+        return summaries
+
     def _validate_request(self, request: RunBenchmarkRequest) -> None:
         if not request.entries:
             raise BenchmarkConfigurationError("No entries provided for benchmark")
@@ -1,8 +1,8 @@
 # application/use_cases/generation/generate_text_use_case.py
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict
 from dataclasses import dataclass
 from datetime import datetime
-from ....domain.model.entities.generation import GeneratedResult, GenerationMetadata
+from ....domain.model.entities.generation import GeneratedResult, GenerationMetadata, GenerationChunk
 from ....domain.ports.llm_port import LLMPort
 from ....domain.ports.logger_port import LoggerPort
 from ....domain.exceptions.generation_error import InvalidPromptError, GenerationLimitExceeded
@@ -65,6 +65,32 @@ class GenerateTextUseCase:
             )
             raise
 
+    def execute_stream(self, request: GenerateTextRequest) -> Iterator[GenerationChunk]:
+        # Validate eagerly so invalid requests fail before the caller starts iterating
+        self._validate_request(request)
+        return self._stream(request)
+
+    def _stream(self, request: GenerateTextRequest) -> Iterator[GenerationChunk]:
+        try:
+            yield from self.llm.generate_stream(
+                system_prompt=request.system_prompt,
+                user_prompt=request.user_prompt,
+                num_sequences=request.num_sequences,
+                max_tokens=request.max_tokens,
+                temperature=request.temperature
+            )
+
+        except Exception as e:
+            self.logger.log(
+                level="ERROR",
+                message=f"Text generation stream failed: {str(e)}",
+                context={
+                    "num_sequences": request.num_sequences,
+                    "max_tokens": request.max_tokens
+                }
+            )
+            raise
+
     def _validate_request(self, request: GenerateTextRequest) -> None:
         if not request.system_prompt.strip():
             raise InvalidPromptError("system", "System prompt cannot be empty")
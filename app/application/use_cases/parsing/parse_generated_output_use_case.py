@@ -1,11 +1,13 @@
 # application/use_cases/parsing/parse_generated_output_use_case.py
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from ....domain.model.entities.parsing import ParseRule, ParsedDocument
 from ....domain.model.value_objects.parse_result import ParseResult
 from ....domain.services.parse_service import ParseService
+from ....domain.services.pattern_cache import PatternCache, get_pattern_cache
 from ....domain.ports.logger_port import LoggerPort
+from ....domain.ports.function_executor_port import FunctionExecutorPort
 from ....domain.exceptions.parsing_error import InvalidParseRule, ParseExecutionError
 
 @dataclass
@@ -14,6 +16,12 @@ class ParseGeneratedOutputRequest:
     rules: List[ParseRule]
     require_all_rules: bool = True
 
+@dataclass
+class BulkParseGeneratedOutputRequest:
+    texts: List[str]
+    rules: List[ParseRule]
+    require_all_rules: bool = True
+
 @dataclass
 class ParseGeneratedOutputResponse:
     parse_result: ParseResult
@@ -22,10 +30,62 @@ class ParseGeneratedOutputResponse:
     successful_rules: List[str]
     failed_rules: List[str]
 
+# Parse services of a worker process, kept between chunks so each worker compiles a rule set once
+_worker_services: Dict[Tuple, ParseService] = {}
+
+@dataclass(frozen=True)
+class _DocumentParser:
+    """Parses one document inside a worker process, configured like the caller's service."""
+    rules: Tuple[ParseRule, ...]
+    max_compiled_rule_sets: int
+    rule_budget: Optional[float]
+    reject_unsafe_patterns: bool
+    # Size of the caller's dedicated pattern cache; None when it uses the shared one
+    pattern_cache_size: Optional[int]
+
+    @classmethod
+    def for_service(cls, service: ParseService, rules: List[ParseRule]) -> '_DocumentParser':
+        dedicated = service.pattern_cache is not get_pattern_cache()
+        return cls(
+            rules=tuple(rules),
+            max_compiled_rule_sets=service.max_compiled_rule_sets,
+            rule_budget=service.rule_budget,
+            reject_unsafe_patterns=service.reject_unsafe_patterns,
+            pattern_cache_size=service.pattern_cache.max_size if dedicated else None
+        )
+
+    def __call__(self, text: str) -> ParseResult:
+        settings = (
+            self.max_compiled_rule_sets,
+            self.rule_budget,
+            self.reject_unsafe_patterns,
+            self.pattern_cache_size
+        )
+        service = _worker_services.get(settings)
+        if service is None:
+            service = ParseService(
+                max_compiled_rule_sets=self.max_compiled_rule_sets,
+                pattern_cache=PatternCache(self.pattern_cache_size) if self.pattern_cache_size else None,
+                rule_budget=self.rule_budget,
+                reject_unsafe_patterns=self.reject_unsafe_patterns
+            )
+            _worker_services[settings] = service
+        parse_result = service.parse_text(text, list(self.rules))
+        # The caller still holds the text, so only the match columns travel back
+        parse_result.matches.detach_source()
+        return parse_result
+
 class ParseGeneratedOutputUseCase:
-    def __init__(self, parse_service: ParseService, logger: LoggerPort):
+    def __init__(
+        self,
+        parse_service: ParseService,
+        logger: LoggerPort,
+        function_executor: Optional[FunctionExecutorPort] = None
+    ):
         self.parse_service = parse_service
         self.logger = logger
+        # Spreads bulk parses over worker processes, when provided
+        self.function_executor = function_executor
 
     def execute(self, request: ParseGeneratedOutputRequest) -> ParseGeneratedOutputResponse:
         self._validate_request(request)
@@ -40,23 +100,8 @@ class ParseGeneratedOutputUseCase:
             
             execution_time = (datetime.now() - start_time).total_seconds()
             
-            # Determine successful and failed rules
-            rule_names = {rule.name for rule in request.rules}
-            matched_rules = set(parse_result.metrics.rules_matched)
-            failed_rules = rule_names - matched_rules
-            
-            if request.require_all_rules and failed_rules:
-                raise ParseExecutionError(
-                    list(failed_rules)[0],
-                    "Required rule did not match any content"
-                )
-            
-            return ParseGeneratedOutputResponse(
-                parse_result=parse_result,
-                execution_time=execution_time,
-                total_matches=parse_result.metrics.total_matches,
-                successful_rules=list(matched_rules),
-                failed_rules=list(failed_rules)
+            return self._build_response(
+                parse_result, request.rules, request.require_all_rules, execution_time
             )
             
         except Exception as e:
@@ -67,11 +112,91 @@ class ParseGeneratedOutputUseCase:
             )
             raise
 
+    def execute_many(self, request: BulkParseGeneratedOutputRequest) -> List[ParseGeneratedOutputResponse]:
+        self._validate_bulk_request(request)
+
+        try:
+            # Compiling here reports invalid rules once, before any document is parsed
+            rule_set = self.parse_service.compile_rules(request.rules)
+
+            executor = self.function_executor
+            if executor is None or len(request.texts) < 2:
+                parse_results = [self.parse_service.parse_text(text, rule_set) for text in request.texts]
+            else:
+                # Workers receive the documents in chunks and return results in order
+                parser = _DocumentParser.for_service(self.parse_service, request.rules)
+                parse_results = executor.map(parser, request.texts)
+                for text, parse_result in zip(request.texts, parse_results):
+                    parse_result.matches.attach_source(text)
+
+            return [
+                self._build_response(
+                    parse_result,
+                    request.rules,
+                    request.require_all_rules,
+                    parse_result.metrics.execution_time,
+                    details={"document_index": index}
+                )
+                for index, parse_result in enumerate(parse_results)
+            ]
+
+        except Exception as e:
+            self.logger.log(
+                level="ERROR",
+                message=f"Bulk parsing failed: {str(e)}",
+                context={
+                    "rules": [rule.name for rule in request.rules],
+                    "documents": len(request.texts)
+                }
+            )
+            raise
+
+    def _build_response(
+        self,
+        parse_result: ParseResult,
+        rules: List[ParseRule],
+        require_all_rules: bool,
+        execution_time: float,
+        details: Optional[Dict[str, Any]] = None
+    ) -> ParseGeneratedOutputResponse:
+        # Determine successful and failed rules
+        rule_names = {rule.name for rule in rules}
+        matched_rules = set(parse_result.metrics.rules_matched)
+        failed_rules = rule_names - matched_rules
+        
+        if require_all_rules and failed_rules:
+            raise ParseExecutionError(
+                list(failed_rules)[0],
+                "Required rule did not match any content",
+                details=details
+            )
+        
+        return ParseGeneratedOutputResponse(
+            parse_result=parse_result,
+            execution_time=execution_time,
+            total_matches=parse_result.metrics.total_matches,
+            successful_rules=list(matched_rules),
+            failed_rules=list(failed_rules)
+        )
+
     def _validate_request(self, request: ParseGeneratedOutputRequest) -> None:
         if not request.text.strip():
             raise InvalidParseRule("any", "Input text cannot be empty")
-        if not request.rules:
+        self._validate_rules(request.rules)
+
+    def _validate_bulk_request(self, request: BulkParseGeneratedOutputRequest) -> None:
+        if not request.texts:
+            raise InvalidParseRule("any", "At least one input text must be provided")
+        for index, text in enumerate(request.texts):
+            if not text.strip():
+                raise InvalidParseRule(
+                    "any", "Input text cannot be empty", details={"document_index": index}
+                )
+        self._validate_rules(request.rules)
+
+    def _validate_rules(self, rules: List[ParseRule]) -> None:
+        if not rules:
             raise InvalidParseRule("any", "At least one parse rule must be provided")
-        for rule in request.rules:
+        for rule in rules:
             if not rule.pattern:
                 raise InvalidParseRule(rule.name, "Rule pattern cannot be empty")
\ No newline at end of file
@@ -2,7 +2,7 @@
 from typing import List, Optional
 from dataclasses import dataclass
 from datetime import datetime
-from ....domain.model.entities.verification import VerificationMethod, VerificationSummary
+from ....domain.model.entities.verification import VerificationMethod, VerificationSummary, VerificationExecutionMode
 from ....domain.services.verifier_service import VerifierService
 from ....domain.ports.logger_port import LoggerPort
 from ....domain.exceptions.verification_error import InvalidVerificationMethod, VerificationExecutionError
@@ -14,6 +14,8 @@ class VerifyTextRequest:
     required_for_confirmed: int
     required_for_review: int
     context: Optional[dict] = None
+    execution_mode: VerificationExecutionMode = VerificationExecutionMode.SEQUENTIAL
+    timeout: Optional[float] = None
 
 @dataclass
 class VerifyTextResponse:
@@ -22,9 +24,16 @@ class VerifyTextResponse:
     success_rate: float
 
 class VerifyTextUseCase:
-    def __init__(self, verifier_service: VerifierService, logger: LoggerPort):
+    def __init__(
+        self,
+        verifier_service: VerifierService,
+        logger: LoggerPort,
+        default_timeout: Optional[float] = None
+    ):
         self.verifier_service = verifier_service
         self.logger = logger
+        # Applies to requests without their own timeout; None leaves them unbounded
+        self.default_timeout = default_timeout
 
     def execute(self, request: VerifyTextRequest) -> VerifyTextResponse:
         self._validate_request(request)
@@ -36,7 +45,9 @@ class VerifyTextUseCase:
                 text=request.text,
                 methods=request.methods,
                 required_for_confirmed=request.required_for_confirmed,
-                required_for_review=request.required_for_review
+                required_for_review=request.required_for_review,
+                execution_mode=request.execution_mode,
+                timeout=request.timeout if request.timeout is not None else self.default_timeout
             )
             
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -48,6 +59,7 @@ class VerifyTextUseCase:
                 context={
                     "success_rate": success_rate,
                     "execution_time": execution_time,
+                    "timed_out": verification_summary.timed_out,
                     "user_context": request.context
                 }
             )
@@ -15,6 +15,11 @@ class DomainError(Exception):
         self.code = code
         self.details = details or {}
 
+    def __reduce__(self):
+        # Subclasses take other constructor arguments than they store, so errors raised
+        # in worker processes are rebuilt from their state rather than re-initialised
+        return (_rebuild_error, (type(self), self.args, self.__dict__))
+
     def __str__(self) -> str:
         return f"[{self.code}] {self.message}"
 
@@ -24,3 +29,9 @@ class DomainError(Exception):
             "message": self.message,
             "details": self.details
         }
+
+def _rebuild_error(error_type: type, args: tuple, state: Dict[str, Any]) -> DomainError:
+    error = error_type.__new__(error_type, *args)
+    error.args = args
+    error.__dict__.update(state)
+    return error
@@ -9,6 +9,7 @@ class GenerationMetadata:
     tokens_used: int
     generation_time: float
     timestamp: datetime = datetime.now()
+    time_to_first_token: Optional[float] = None
 
 @dataclass(frozen=True)
 class GeneratedResult:
@@ -20,4 +21,11 @@ class GeneratedResult:
         return text.lower() in self.content.lower()
 
     def word_count(self) -> int:
-        return len(self.content.split())
\ No newline at end of file
+        return len(self.content.split())
+
+@dataclass(frozen=True)
+class GenerationChunk:
+    sequence_index: int
+    text: str
+    is_final: bool = False
+    metadata: Optional[GenerationMetadata] = None
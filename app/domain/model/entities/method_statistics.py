@@ -0,0 +1,128 @@
+# domain/model/entities/method_statistics.py
+from typing import Any, Callable, Optional
+from dataclasses import dataclass, replace
+import hashlib
+import types
+import weakref
+from .verification import VerificationMethod, VerificationMethodType
+
+@dataclass(frozen=True)
+class MethodStatistics:
+    method_key: str
+    method_name: str
+    method_type: VerificationMethodType
+    executions: int = 0
+    passes: int = 0
+    decisive: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        if self.executions == 0:
+            return 0.0
+        return self.total_latency / self.executions
+
+    @property
+    def pass_rate(self) -> float:
+        if self.executions == 0:
+            return 0.0
+        return self.passes / self.executions
+
+    @property
+    def decisive_rate(self) -> float:
+        if self.executions == 0:
+            return 0.0
+        return self.decisive / self.executions
+
+    def record(self, passed: bool, decisive: bool, latency: float) -> 'MethodStatistics':
+        return replace(
+            self,
+            executions=self.executions + 1,
+            passes=self.passes + int(passed),
+            decisive=self.decisive + int(decisive),
+            total_latency=self.total_latency + latency
+        )
+
+def method_fingerprint(method: VerificationMethod) -> str:
+    # Methods sharing a name may be configured differently, and their results
+    # differ with it, so the whole configuration is part of the fingerprint
+    parts = [
+        method.method_type.value,
+        method.mode.value,
+        method.thresholds,
+        method.reference_text,
+        method.required_matches,
+        method.consensus_mode.value,
+        method.cascade,
+        getattr(method, 'pattern', None)
+    ]
+    function = getattr(method, 'verification_function', None)
+    if function is not None:
+        # Without a stable digest, functions are told apart by qualified name alone so
+        # their statistics stay under one key across processes; results are not cached
+        parts.append(function_fingerprint(function) or f"{_function_name(function)}:unfingerprinted")
+    configuration = "\0".join(str(part) for part in parts)
+    return hashlib.blake2b(configuration.encode("utf-8"), digest_size=8).hexdigest()
+
+def method_statistics_key(method: VerificationMethod) -> str:
+    return f"{method.name}:{method_fingerprint(method)}"
+
+# Digests of functions seen so far, dropped with the functions themselves
+_function_fingerprints: "weakref.WeakKeyDictionary[Callable, Optional[str]]" = weakref.WeakKeyDictionary()
+
+def function_fingerprint(function: Callable[..., Any]) -> Optional[str]:
+    """Digest of a function's name, code, defaults and captured values.
+
+    Returns None when any of them has no stable representation, e.g. an object
+    whose repr is its identity, since two such functions cannot be told apart.
+    """
+    try:
+        return _function_fingerprints[function]
+    except (KeyError, TypeError):
+        pass
+
+    code = getattr(function, '__code__', None)
+    if code is None:
+        parts = [_stable_repr(function)]
+    else:
+        cells = []
+        for cell in function.__closure__ or ():
+            try:
+                cells.append(cell.cell_contents)
+            except ValueError:
+                cells.append("<empty>")
+        parts = [
+            _function_name(function),
+            _stable_repr(code),
+            _stable_repr(function.__defaults__),
+            _stable_repr(function.__kwdefaults__),
+            _stable_repr(tuple(cells))
+        ]
+
+    fingerprint = None
+    if None not in parts:
+        fingerprint = hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+    try:
+        _function_fingerprints[function] = fingerprint
+    except TypeError:
+        # Not weakly referenceable; computed again next time
+        pass
+    return fingerprint
+
+def _function_name(function: Callable[..., Any]) -> str:
+    return f"{getattr(function, '__module__', '')}.{getattr(function, '__qualname__', repr(function))}"
+
+def _stable_repr(value: Any) -> Optional[str]:
+    if isinstance(value, types.CodeType):
+        parts = [value.co_code.hex(), repr(value.co_names)] + [_stable_repr(const) for const in value.co_consts]
+    elif isinstance(value, (tuple, list, frozenset)):
+        parts = [_stable_repr(item) for item in value]
+    elif isinstance(value, dict):
+        parts = [_stable_repr(item) for item in value.items()]
+    else:
+        text = repr(value)
+        # Default reprs identify the object, not its content
+        return None if " at 0x" in text else text
+    if None in parts:
+        return None
+    return f"{type(value).__name__}({','.join(parts)})"
@@ -24,6 +24,7 @@ class ParseRule:
     scope: ParseScope = ParseScope.ALL_TEXT
     strategy: ParseStrategy = ParseStrategy.FIRST_MATCH
     fallback_value: Optional[str] = None
+    secondary_pattern: Optional[str] = None
 
 @dataclass(frozen=True)
 class ParseEntry:
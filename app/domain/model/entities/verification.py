@@ -1,19 +1,32 @@
 # domain/model/entities/verification.py
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from typing import Any, Callable, List, Optional, Dict, Tuple
 from enum import Enum
 from datetime import datetime
+from ..value_objects.verification_status import VerificationStatus
 
 class VerificationMethodType(Enum):
     EMBEDDING = "embedding"
     CONSENSUS = "consensus"
     REGEX = "regex"
     CUSTOM = "custom"
+    CASCADE = "cascade"
 
 class VerificationMode(Enum):
     ELIMINATORY = "eliminatory"
     CUMULATIVE = "cumulative"
 
+class ConsensusMode(Enum):
+    SAMPLING = "sampling"
+    LOGIT = "logit"
+    SEQUENTIAL = "sequential"
+
+class VerificationExecutionMode(Enum):
+    SEQUENTIAL = "sequential"
+    COST_ORDERED = "cost_ordered"
+    ADAPTIVE = "adaptive"
+    CONCURRENT = "concurrent"
+
 @dataclass(frozen=True)
 class VerificationThresholds:
     lower_bound: float
@@ -23,6 +36,21 @@ class VerificationThresholds:
     def is_within_bounds(self, value: float) -> bool:
         return self.lower_bound <= value <= self.upper_bound
 
+@dataclass(frozen=True)
+class CascadeConfig:
+    # First stage: either labelled exemplars or a logistic model over the text embedding
+    positive_exemplars: Tuple[str, ...] = ()
+    negative_exemplars: Tuple[str, ...] = ()
+    weights: Optional[Tuple[float, ...]] = None
+    bias: float = 0.0
+    # Scores in [reject_below, accept_above] are escalated to LLM consensus
+    accept_above: float = 0.8
+    reject_below: float = 0.2
+
+    @property
+    def uses_exemplars(self) -> bool:
+        return self.weights is None
+
 @dataclass(frozen=True)
 class VerificationMethod:
     name: str
@@ -31,6 +59,10 @@ class VerificationMethod:
     thresholds: Optional[VerificationThresholds] = None
     reference_text: Optional[str] = None
     required_matches: Optional[int] = None
+    consensus_mode: ConsensusMode = ConsensusMode.SAMPLING
+    cascade: Optional[CascadeConfig] = None
+    pattern: Optional[str] = None
+    verification_function: Optional[Callable[[str], Any]] = None
 
 @dataclass(frozen=True)
 class VerificationResult:
@@ -39,6 +71,7 @@ class VerificationResult:
     score: Optional[float] = None
     details: Optional[Dict[str, any]] = None
     timestamp: datetime = datetime.now()
+    skipped: bool = False
 
 @dataclass(frozen=True)
 class VerificationSummary:
@@ -52,10 +85,22 @@ class VerificationSummary:
     
     @property
     def failed_methods(self) -> List[str]:
-        return [result.method.name for result in self.results if not result.passed]
+        return [
+            result.method.name for result in self.results
+            if not result.passed and not result.skipped
+        ]
+    
+    @property
+    def skipped_methods(self) -> List[str]:
+        return [result.method.name for result in self.results if result.skipped]
+    
+    @property
+    def timed_out(self) -> bool:
+        return self.final_status == VerificationStatus.TIMEOUT.value
     
     @property
     def success_rate(self) -> float:
-        if not self.results:
+        executed = [result for result in self.results if not result.skipped]
+        if not executed:
             return 0.0
-        return len(self.passed_methods) / len(self.results)
+        return len(self.passed_methods) / len(executed)
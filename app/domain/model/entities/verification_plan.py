@@ -0,0 +1,23 @@
+# domain/model/entities/verification_plan.py
+from dataclasses import dataclass
+from typing import List, Optional, Pattern, Tuple
+from .verification import VerificationMethod
+
+@dataclass(frozen=True)
+class PlannedVerification:
+    method: VerificationMethod
+    reference_embedding: Optional[Tuple[float, ...]] = None
+    compiled_pattern: Optional[Pattern] = None
+    positive_embeddings: Optional[Tuple[Tuple[float, ...], ...]] = None
+    negative_embeddings: Optional[Tuple[Tuple[float, ...], ...]] = None
+
+@dataclass(frozen=True)
+class VerificationPlan:
+    steps: Tuple[PlannedVerification, ...]
+
+    @property
+    def methods(self) -> List[VerificationMethod]:
+        return [step.method for step in self.steps]
+
+    def __len__(self) -> int:
+        return len(self.steps)
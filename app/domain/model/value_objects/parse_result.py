@@ -1,20 +1,32 @@
 # domain/model/value_objects/parse_result.py
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+# start, end, line_number, absolute_start, value_start, value_end, confidence;
+# value offsets are absolute, so values can be sliced from the document later
+MatchRow = Tuple[int, int, Optional[int], int, int, int, float]
+
+_NO_LINE = -1
+
 @dataclass(frozen=True)
 class ParseMetrics:
     total_matches: int
     execution_time: float
     chars_processed: int
     rules_matched: List[str]
+    # Seconds spent matching each rule; a pass shared by several rules is split evenly
+    rule_timings: Dict[str, float] = field(default_factory=dict)
 
 @dataclass(frozen=True)
 class ParseLocation:
     start: int
     end: int
     line_number: Optional[int] = None
+    # Offsets within the whole document; start/end are relative to the line for line rules
+    absolute_start: Optional[int] = None
+    absolute_end: Optional[int] = None
     
     def length(self) -> int:
         return self.end - self.start
@@ -26,25 +38,171 @@ class ParseMatch:
     rule_name: str
     confidence: float = 1.0
 
+class ParseMatchTable(Sequence[ParseMatch]):
+    """Matches stored column by column, with ParseMatch objects built only on access.
+
+    Values are sliced from the source text when it is known; tables built from
+    existing ParseMatch objects keep their values instead.
+    """
+
+    def __init__(self, source_text: Optional[str] = None):
+        self.source_text = source_text
+        self.rule_names: List[str] = []
+        self._rule_ids: Dict[str, int] = {}
+        self.rule_ids = array('i')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.line_numbers = array('q')
+        self.absolute_starts = array('q')
+        self.absolute_ends = array('q')
+        self.value_starts = array('q')
+        self.value_ends = array('q')
+        self.confidences = array('d')
+        self._values: Optional[List[str]] = None if source_text is not None else []
+        self._index: Optional[Dict[int, array]] = None
+        self._best: Dict[int, int] = {}
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[ParseMatch]) -> 'ParseMatchTable':
+        table = cls()
+        for match in matches:
+            location = match.location
+            absolute_start = location.absolute_start if location.absolute_start is not None else _NO_LINE
+            absolute_end = location.absolute_end if location.absolute_end is not None else _NO_LINE
+            table._append(
+                match.rule_name,
+                (location.start, location.end, location.line_number, absolute_start, -1, -1, match.confidence),
+                absolute_end
+            )
+            table._values.append(match.value)
+        return table
+
+    def extend(self, rule_name: str, rows: Iterable[MatchRow]) -> None:
+        if self.source_text is None:
+            raise ValueError("Rows can only be added to a table with source text")
+        for row in rows:
+            self._append(rule_name, row, row[3] + row[1] - row[0])
+
+    def _append(self, rule_name: str, row: MatchRow, absolute_end: int) -> None:
+        rule_id = self._rule_ids.get(rule_name)
+        if rule_id is None:
+            rule_id = self._rule_ids[rule_name] = len(self.rule_names)
+            self.rule_names.append(rule_name)
+        start, end, line_number, absolute_start, value_start, value_end, confidence = row
+        self.rule_ids.append(rule_id)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.line_numbers.append(line_number if line_number is not None else _NO_LINE)
+        self.absolute_starts.append(absolute_start)
+        self.absolute_ends.append(absolute_end)
+        self.value_starts.append(value_start)
+        self.value_ends.append(value_end)
+        self.confidences.append(confidence)
+        self._index = None
+
+    def detach_source(self) -> None:
+        # Lets a table cross a process boundary without its text; the receiver,
+        # which already holds the text, reattaches it before reading values
+        if self._values is None:
+            self.source_text = None
+
+    def attach_source(self, source_text: str) -> None:
+        if self._values is None:
+            self.source_text = source_text
+
+    def rows_for(self, rule_name: str) -> Sequence[int]:
+        rule_id = self._rule_ids.get(rule_name)
+        if rule_id is None:
+            return ()
+        return self._rule_index()[rule_id]
+
+    def _rule_index(self) -> Dict[int, array]:
+        if self._index is None:
+            # Built once on the first lookup, along with each rule's most confident row
+            index: Dict[int, array] = {position: array('q') for position in range(len(self.rule_names))}
+            best: Dict[int, int] = {}
+            confidences = self.confidences
+            for row, row_rule in enumerate(self.rule_ids):
+                index[row_rule].append(row)
+                current = best.get(row_rule)
+                if current is None or confidences[row] > confidences[current]:
+                    best[row_rule] = row
+            self._index = index
+            self._best = best
+        return self._index
+
+    def value(self, row: int) -> str:
+        if self._values is not None:
+            return self._values[row]
+        return self.source_text[self.value_starts[row]:self.value_ends[row]]
+
+    def values_for(self, rule_name: str) -> List[str]:
+        return [self.value(row) for row in self.rows_for(rule_name)]
+
+    def best_row(self, rule_name: str) -> Optional[int]:
+        rule_id = self._rule_ids.get(rule_name)
+        if rule_id is None:
+            return None
+        self._rule_index()
+        return self._best.get(rule_id)
+
+    def match(self, row: int) -> ParseMatch:
+        line_number = self.line_numbers[row]
+        absolute_start = self.absolute_starts[row]
+        absolute_end = self.absolute_ends[row]
+        return ParseMatch(
+            value=self.value(row),
+            location=ParseLocation(
+                start=self.starts[row],
+                end=self.ends[row],
+                line_number=line_number if line_number != _NO_LINE else None,
+                absolute_start=absolute_start if absolute_start != _NO_LINE else None,
+                absolute_end=absolute_end if absolute_end != _NO_LINE else None
+            ),
+            rule_name=self.rule_names[self.rule_ids[row]],
+            confidence=self.confidences[row]
+        )
+
+    def __len__(self) -> int:
+        return len(self.rule_ids)
+
+    def __getitem__(self, row: Union[int, slice]) -> Union[ParseMatch, List[ParseMatch]]:
+        if isinstance(row, slice):
+            return [self.match(position) for position in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("match index out of range")
+        return self.match(row)
+
+    def __iter__(self) -> Iterator[ParseMatch]:
+        return (self.match(row) for row in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
 @dataclass(frozen=True)
 class ParseResult:
-    matches: List[ParseMatch]
+    matches: Sequence[ParseMatch]
     metrics: ParseMetrics
     timestamp: datetime = datetime.now()
 
+    def __post_init__(self):
+        if not isinstance(self.matches, ParseMatchTable):
+            object.__setattr__(self, 'matches', ParseMatchTable.from_matches(self.matches))
+
     def get_best_match(self, rule_name: str) -> Optional[ParseMatch]:
-        relevant_matches = [m for m in self.matches if m.rule_name == rule_name]
-        if not relevant_matches:
+        row = self.matches.best_row(rule_name)
+        if row is None:
             return None
-        return max(relevant_matches, key=lambda m: m.confidence)
+        return self.matches.match(row)
 
     def get_all_matches(self, rule_name: str) -> List[ParseMatch]:
-        return [m for m in self.matches if m.rule_name == rule_name]
+        return [self.matches.match(row) for row in self.matches.rows_for(rule_name)]
 
     def to_dict(self) -> Dict[str, List[str]]:
-        result = {}
-        for match in self.matches:
-            if match.rule_name not in result:
-                result[match.rule_name] = []
-            result[match.rule_name].append(match.value)
-        return result
\ No newline at end of file
+        return {rule_name: self.matches.values_for(rule_name) for rule_name in self.matches.rule_names}
\ No newline at end of file
@@ -1,6 +1,7 @@
 # domain/model/value_objects/similarity_score.py
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
+import math
 
 @dataclass(frozen=True)
 class SimilarityScore:
@@ -27,4 +28,12 @@ class SimilarityScore:
         return (self.value == other.value and 
                 self.method == other.method and 
                 self.reference_text == other.reference_text and 
-                self.compared_text == other.compared_text)
\ No newline at end of file
+                self.compared_text == other.compared_text)
+
+def cosine_similarity(vector1: Sequence[float], vector2: Sequence[float]) -> float:
+    dot = sum(a * b for a, b in zip(vector1, vector2))
+    norm1 = math.sqrt(sum(a * a for a in vector1))
+    norm2 = math.sqrt(sum(b * b for b in vector2))
+    if norm1 == 0.0 or norm2 == 0.0:
+        return 0.0
+    return dot / (norm1 * norm2)
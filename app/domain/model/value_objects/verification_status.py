@@ -6,6 +6,7 @@ class VerificationStatus(Enum):
     CONFIRMED = "confirmada"
     DISCARDED = "descartada"
     REVIEW = "a revisar"
+    TIMEOUT = "tiempo agotado"
 
     @classmethod
     def from_string(cls, status: str) -> Optional['VerificationStatus']:
@@ -17,5 +18,8 @@ class VerificationStatus(Enum):
     def is_final(self) -> bool:
         return self in [VerificationStatus.CONFIRMED, VerificationStatus.DISCARDED]
 
+    def is_timeout(self) -> bool:
+        return self == VerificationStatus.TIMEOUT
+
     def requires_review(self) -> bool:
         return self == VerificationStatus.REVIEW
\ No newline at end of file
@@ -31,6 +31,19 @@ class EmbeddingsPort(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get the embedding vectors for several texts at once.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            List of embedding vectors, in the same order as the input texts
+        """
+        pass
+    
     @abstractmethod
     def batch_similarities(self, reference_text: str, comparison_texts: List[str]) -> List[SimilarityScore]:
         """
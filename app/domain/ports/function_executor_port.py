@@ -0,0 +1,51 @@
+# domain/ports/function_executor_port.py
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List, Optional
+
+class FunctionExecutorPort(ABC):
+    @abstractmethod
+    def map(
+        self,
+        function: Callable[[Any], Any],
+        items: List[Any],
+        timeout: Optional[float] = None,
+        max_total_time: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Apply a function to every item outside the calling thread.
+        
+        Args:
+            function: Function to apply; must be transferable to the workers
+            items: Items to apply the function to
+            timeout: Optional allowance in seconds per call, enforced over the
+                calls of the map together rather than on each call
+            max_total_time: Optional limit in seconds for the whole map; calls still
+                running when it runs out are left to finish and their results dropped
+            
+        Returns:
+            Results in the order of the items
+            
+        Raises:
+            TimeoutError: If the map runs past its calls' allowance or max_total_time
+            concurrent.futures.BrokenExecutor: If the workers stopped while running the map
+            RuntimeError: If the executor has been closed
+        """
+        pass
+
+    @abstractmethod
+    def supports(self, function: Callable[[Any], Any]) -> bool:
+        """
+        Check whether a function can be run by this executor.
+        
+        Args:
+            function: Function to check
+            
+        Returns:
+            True if the function can be sent to the workers, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop the workers and release their resources."""
+        pass
@@ -1,7 +1,8 @@
 # domain/ports/llm_port.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
-from ..model.entities.generation import GeneratedResult
+from typing import Iterator, List, Optional, Dict, Tuple
+import time
+from ..model.entities.generation import GeneratedResult, GenerationChunk
 
 class LLMPort(ABC):
     @abstractmethod
@@ -12,7 +13,8 @@ class LLMPort(ABC):
         num_sequences: int = 1,
         max_tokens: int = 100,
         temperature: float = 1.0,
-        stop_sequences: Optional[List[str]] = None
+        stop_sequences: Optional[List[str]] = None,
+        max_time: Optional[float] = None
     ) -> List[GeneratedResult]:
         """
         Generate text using the language model.
@@ -24,12 +26,128 @@ class LLMPort(ABC):
             max_tokens: Maximum number of tokens to generate
             temperature: Sampling temperature
             stop_sequences: Optional list of sequences that will stop generation
+            max_time: Optional wall-clock budget in seconds; generation stops when it runs out
             
         Returns:
             List of GeneratedResult objects containing the generated texts and metadata
         """
         pass
 
+    @abstractmethod
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None
+    ) -> Iterator[GenerationChunk]:
+        """
+        Generate text using the language model, yielding text as it is decoded.
+        
+        Args:
+            system_prompt: System-level instructions for the model
+            user_prompt: User input/question
+            num_sequences: Number of different sequences to generate
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature
+            stop_sequences: Optional list of sequences that will stop generation
+            
+        Returns:
+            Iterator of GenerationChunk objects with incremental text per sequence.
+            Each sequence ends with a final chunk carrying its GenerationMetadata,
+            including the time to its first token
+        """
+        pass
+
+    @abstractmethod
+    def score_next_token(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        candidates: List[str]
+    ) -> Dict[str, float]:
+        """
+        Score candidate answers by the probability of the model's next token.
+        
+        Args:
+            system_prompt: System-level instructions for the model
+            user_prompt: User input/question
+            candidates: Candidate answers (e.g. 'yes', 'no') to score
+            
+        Returns:
+            Dictionary mapping each candidate to the probability mass the model
+            assigns to it (including case and leading-space variants) as the next token
+        """
+        pass
+
+    def generate_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        max_time: Optional[float] = None
+    ) -> List[List[GeneratedResult]]:
+        """
+        Generate text for several prompts, batching them where the model supports it.
+        
+        Args:
+            prompts: List of (system_prompt, user_prompt) pairs
+            num_sequences: Number of different sequences to generate per prompt
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature
+            stop_sequences: Optional list of sequences that will stop generation
+            max_time: Optional wall-clock budget in seconds for the whole batch
+            
+        Returns:
+            One list of GeneratedResult objects per prompt, in the order of the prompts.
+            Prompts not reached within max_time get an empty list
+        """
+        deadline = time.monotonic() + max_time if max_time is not None else None
+        results = []
+        for system_prompt, user_prompt in prompts:
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                results.append([])
+                continue
+            results.append(self.generate(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                num_sequences=num_sequences,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stop_sequences=stop_sequences,
+                max_time=remaining
+            ))
+        return results
+
+    def score_next_token_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        candidates: List[str]
+    ) -> List[Dict[str, float]]:
+        """
+        Score candidate answers for several prompts, batching them where the model supports it.
+        
+        Args:
+            prompts: List of (system_prompt, user_prompt) pairs
+            candidates: Candidate answers (e.g. 'yes', 'no') to score
+            
+        Returns:
+            One dictionary of candidate probabilities per prompt, in the order of the prompts
+        """
+        return [
+            self.score_next_token(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                candidates=candidates
+            )
+            for system_prompt, user_prompt in prompts
+        ]
+
     @abstractmethod
     def get_token_count(self, text: str) -> int:
         """
@@ -0,0 +1,30 @@
+# domain/ports/statistics_port.py
+from abc import ABC, abstractmethod
+from typing import List
+from ..model.entities.method_statistics import MethodStatistics
+
+class MethodStatisticsPort(ABC):
+    @abstractmethod
+    def load(self) -> List[MethodStatistics]:
+        """
+        Load the persisted statistics of every verification method.
+        
+        Returns:
+            List of MethodStatistics, empty if nothing has been stored yet
+        """
+        pass
+
+    @abstractmethod
+    def save(self, statistics: List[MethodStatistics]) -> None:
+        """
+        Store updated statistics, replacing any previous entry with the same method key.
+        
+        Args:
+            statistics: Statistics of the methods that changed
+        """
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Write any buffered statistics to durable storage."""
+        pass
@@ -0,0 +1,486 @@
+# domain/services/compiled_rule_set.py
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import groupby
+import logging
+import re
+import time
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+from ..model.entities.parsing import ParseRule, ParseMode, ParseScope, ParseStrategy
+from ..model.value_objects.parse_result import MatchRow, ParseMatch, ParseLocation
+from ..exceptions.parsing_error import ParseExecutionError
+from .pattern_cache import PatternCache, get_pattern_cache
+from .regex_guard import regex_budget
+
+logger = logging.getLogger(__name__)
+
+_Hit = TypeVar('_Hit', Tuple[int, int], Tuple[int, int, int, int])
+
+# Line boundaries str.splitlines honours besides "\n"
+_OTHER_LINE_BREAKS = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+class _RuleClock:
+    """Times each unit of matching and holds it to the rules' time budget.
+
+    A unit shared by several rules, like a combined scan, gets the sum of their
+    budgets and its time is split evenly between them.
+    """
+
+    def __init__(self, budget: Optional[float] = None, timings: Optional[Dict[str, float]] = None):
+        self.budget = budget
+        self.timings = timings
+
+    @contextmanager
+    def measure(self, rules: Sequence[ParseRule]) -> Iterator[None]:
+        if not rules or (self.budget is None and self.timings is None):
+            yield
+            return
+
+        names = [rule.name for rule in rules]
+        budget = None if self.budget is None else self.budget * len(names)
+        start = time.perf_counter()
+        try:
+            with regex_budget(budget, lambda elapsed: ParseExecutionError(
+                ", ".join(names), f"Matching stopped after {elapsed:.3f}s, over its {budget:g}s budget"
+            )):
+                yield
+        finally:
+            if self.timings is not None:
+                share = (time.perf_counter() - start) / len(names)
+                for name in names:
+                    self.timings[name] = self.timings.get(name, 0.0) + share
+
+_UNMEASURED = _RuleClock()
+
+class _RuleScanner:
+    """Finds the matches of several rules with one pass of a combined regex.
+
+    Every rule gets a lookahead capture, so at each position the scanner stops at,
+    each rule reports the match re.finditer would find if it searched from there.
+    Rules whose semantics would change inside the combined pattern are applied
+    on their own instead.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[Tuple[int, ParseRule]],
+        patterns: PatternCache,
+        multiline: bool = False
+    ):
+        self.rules = list(rules)
+        self.patterns = patterns
+        self.fallback: List[Tuple[int, ParseRule]] = []
+        combined: List[Tuple[int, ParseRule, str]] = []
+
+        for index, rule in self.rules:
+            fragment = _scanner_fragment(rule, patterns, multiline)
+            if fragment is None:
+                self.fallback.append((index, rule))
+            else:
+                combined.append((index, rule, fragment))
+
+        self.pattern: Optional[re.Pattern] = None
+        self.members: List[Tuple[int, ParseRule, int]] = []
+        self._groups: List[Tuple[int, List[int]]] = []
+        if combined:
+            # Rules sharing a pattern share one capture group
+            fragments = list(dict.fromkeys(fragment for _, _, fragment in combined))
+            # The leading lookahead only lets the scan stop where some rule matches;
+            # the optional captures then record which rules match there
+            any_rule = "|".join(f"(?:{fragment})" for fragment in fragments)
+            captures = "".join(
+                f"(?:(?=(?P<_r{position}>{fragment})))?"
+                for position, fragment in enumerate(fragments)
+            )
+            self.pattern = patterns.compile(
+                f"(?=(?:{any_rule})){captures}",
+                re.MULTILINE if multiline else 0
+            )
+            self.members = [
+                (index, rule, self.pattern.groupindex[f"_r{fragments.index(fragment)}"])
+                for index, rule, fragment in combined
+            ]
+            self._groups = [
+                (
+                    self.pattern.groupindex[f"_r{position}"],
+                    [index for index, _, member_fragment in combined if member_fragment == fragment]
+                )
+                for position, fragment in enumerate(fragments)
+            ]
+        self._first_only = bool(self.members) and all(
+            rule.strategy == ParseStrategy.FIRST_MATCH for _, rule, _ in self.members
+        )
+
+    def spans(self, text: str) -> Dict[int, List[Tuple[int, int]]]:
+        spans: Dict[int, List[Tuple[int, int]]] = {index: [] for index, _, _ in self.members}
+        if self.pattern is None:
+            return spans
+
+        if self._first_only:
+            # Every rule only needs its first hit, so the scan stops once each has one
+            scans = []
+            pending = {group for group, _ in self._groups}
+            for scan in self.pattern.finditer(text):
+                regs = scan.regs
+                scans.append(regs)
+                pending = {group for group in pending if regs[group][1] == -1}
+                if not pending:
+                    break
+        else:
+            scans = [scan.regs for scan in self.pattern.finditer(text)]
+
+        for group, rules in self._groups:
+            # Emulate finditer: matches of one rule never overlap
+            non_overlapping = []
+            next_allowed = 0
+            for regs in scans:
+                start, end = regs[0][0], regs[group][1]
+                if end != -1 and start >= next_allowed:
+                    non_overlapping.append((start, end))
+                    next_allowed = end
+            for index in rules:
+                spans[index] = non_overlapping
+        return spans
+
+    def match(
+        self,
+        text: str,
+        line_number: Optional[int] = None,
+        offset: int = 0,
+        clock: _RuleClock = _UNMEASURED
+    ) -> Dict[int, List[MatchRow]]:
+        with clock.measure([rule for _, rule, _ in self.members]):
+            spans = self.spans(text)
+        results: Dict[int, List[MatchRow]] = {}
+        for index, rule, _ in self.members:
+            results[index] = [
+                _regex_row(start, end, line_number, start + offset)
+                for start, end in _select_hits(spans[index], rule.strategy, _span_length)
+            ]
+
+        for index, rule in self.fallback:
+            with clock.measure([rule]):
+                results[index] = apply_rule(text, rule, line_number, offset, self.patterns)
+
+        return results
+
+class CompiledRuleSet:
+    """Parse rules prepared for matching all of them in a single traversal of the text."""
+
+    def __init__(self, rules: Sequence[ParseRule], patterns: Optional[PatternCache] = None):
+        self.rules: Tuple[ParseRule, ...] = tuple(rules)
+        self.patterns = patterns or get_pattern_cache()
+        indexed = list(enumerate(self.rules))
+        self._text_scanner = _RuleScanner(
+            [(index, rule) for index, rule in indexed if rule.scope != ParseScope.LINE_BY_LINE],
+            self.patterns
+        )
+        # Line rules run over the whole text in multiline mode; line numbers are
+        # recovered from the match offsets afterwards
+        self._line_scanner = _RuleScanner(
+            [(index, rule) for index, rule in indexed if rule.scope == ParseScope.LINE_BY_LINE],
+            self.patterns,
+            multiline=True
+        )
+
+    @property
+    def fallback_rules(self) -> List[str]:
+        return [rule.name for _, rule in self._text_scanner.fallback + self._line_scanner.fallback]
+
+    def match(
+        self,
+        text: str,
+        offset: int = 0,
+        first_line: int = 1,
+        budget: Optional[float] = None,
+        timings: Optional[Dict[str, float]] = None
+    ) -> List[List[MatchRow]]:
+        # offset and first_line place text within a larger document, e.g. a streamed chunk.
+        # budget bounds the seconds spent per rule; timings accumulates them by rule name
+        results: List[List[MatchRow]] = [[] for _ in self.rules]
+        clock = _RuleClock(budget, timings)
+
+        if self._text_scanner.rules:
+            for index, matches in self._text_scanner.match(text, offset=offset, clock=clock).items():
+                results[index] = matches
+
+        if self._line_scanner.rules:
+            if _OTHER_LINE_BREAKS.search(text):
+                # Offsets of "\n" alone would not reproduce splitlines numbering
+                with clock.measure([rule for _, rule in self._line_scanner.rules]):
+                    self._match_split_lines(
+                        text, results, self._line_scanner.rules, offset, first_line, use_scanner=True
+                    )
+            else:
+                self._match_indexed_lines(text, results, offset, first_line, clock)
+
+        return results
+
+    def _match_indexed_lines(
+        self,
+        text: str,
+        results: List[List[MatchRow]],
+        offset: int,
+        first_line: int,
+        clock: _RuleClock
+    ) -> None:
+        line_starts = [0]
+        position = text.find("\n")
+        while position != -1:
+            line_starts.append(position + 1)
+            position = text.find("\n", position + 1)
+
+        def line_of(hit: Tuple) -> int:
+            return bisect_right(line_starts, hit[0])
+
+        per_line = []
+        for index, rule in self._line_scanner.fallback:
+            if rule.mode != ParseMode.KEYWORD or not rule.pattern or "\n" in rule.pattern:
+                per_line.append((index, rule))
+                continue
+            # Keyword values stop at the end of the line the keyword is on
+            hits = _keyword_hits(
+                text, rule, lambda start, keyword=rule.pattern: text.find(keyword, start), line_bounded=True
+            )
+            rows = []
+            with clock.measure([rule]):
+                for start, end, value_start, value_end in _select_line_hits(
+                    hits, rule.strategy, _keyword_length, line_of
+                ):
+                    line_number = line_of((start,))
+                    line_start = line_starts[line_number - 1]
+                    rows.append(_keyword_row(
+                        start - line_start, end - line_start, line_number + first_line - 1,
+                        start + offset, value_start + offset, value_end + offset
+                    ))
+            results[index] = rows
+
+        with clock.measure([rule for _, rule, _ in self._line_scanner.members]):
+            spans = self._line_scanner.spans(text)
+        for index, rule, _ in self._line_scanner.members:
+            rule_spans = spans[index]
+            checked = rule_spans[:1] if rule.strategy == ParseStrategy.FIRST_MATCH else rule_spans
+            if any(text.find("\n", start, end) != -1 for start, end in checked):
+                # A match spanning lines would have been cut short on a single line
+                per_line.append((index, rule))
+                continue
+            rows = []
+            for start, end in _select_line_hits(rule_spans, rule.strategy, _span_length, line_of):
+                line_number = line_of((start,))
+                line_start = line_starts[line_number - 1]
+                rows.append(_regex_row(
+                    start - line_start, end - line_start, line_number + first_line - 1, start + offset
+                ))
+            results[index] = rows
+
+        if per_line:
+            with clock.measure([rule for _, rule in per_line]):
+                self._match_split_lines(text, results, per_line, offset, first_line, use_scanner=False)
+
+    def _match_split_lines(
+        self,
+        text: str,
+        results: List[List[MatchRow]],
+        rules: List[Tuple[int, ParseRule]],
+        offset: int,
+        first_line: int,
+        use_scanner: bool
+    ) -> None:
+        finished = set()
+        for line_number, (line, raw_line) in enumerate(
+            zip(text.splitlines(), text.splitlines(keepends=True)), first_line
+        ):
+            if len(finished) == len(rules):
+                break
+            if use_scanner:
+                line_results = self._line_scanner.match(line, line_number, offset)
+            else:
+                line_results = {
+                    index: apply_rule(line, rule, line_number, offset, self.patterns)
+                    for index, rule in rules if index not in finished
+                }
+            offset += len(raw_line)
+            for index, matches in line_results.items():
+                if index in finished or not matches:
+                    continue
+                results[index].extend(matches)
+                if self.rules[index].strategy == ParseStrategy.FIRST_MATCH:
+                    finished.add(index)
+
+def apply_rule(
+    text: str,
+    rule: ParseRule,
+    line_number: Optional[int] = None,
+    offset: int = 0,
+    patterns: Optional[PatternCache] = None
+) -> List[MatchRow]:
+    if rule.mode == ParseMode.REGEX:
+        pattern = _rule_pattern(rule, patterns)
+        if rule.strategy == ParseStrategy.FIRST_MATCH:
+            found = pattern.search(text)
+            hits = [found.span()] if found else []
+        else:
+            hits = _select_hits(
+                (found.span() for found in pattern.finditer(text)), rule.strategy, _span_length
+            )
+        return [_regex_row(start, end, line_number, start + offset) for start, end in hits]
+    elif rule.mode == ParseMode.KEYWORD:
+        hits = _keyword_hits(text, rule, lambda start: text.find(rule.pattern, start))
+        return [
+            _keyword_row(start, end, line_number, start + offset, value_start + offset, value_end + offset)
+            for start, end, value_start, value_end in _select_hits(hits, rule.strategy, _keyword_length)
+        ]
+    return []
+
+def _keyword_hits(
+    text: str,
+    rule: ParseRule,
+    next_occurrence: Callable[[int], int],
+    line_bounded: bool = False
+) -> Iterator[Tuple[int, int, int, int]]:
+    start = 0
+    while True:
+        start_idx = next_occurrence(start)
+        if start_idx == -1:
+            return
+
+        limit = len(text)
+        if line_bounded:
+            line_end = text.find("\n", start_idx)
+            if line_end != -1:
+                limit = line_end
+
+        end_idx = limit
+        if rule.secondary_pattern:
+            end_match = text.find(rule.secondary_pattern, start_idx + len(rule.pattern), limit)
+            if end_match != -1:
+                end_idx = end_match
+
+        raw_value = text[start_idx + len(rule.pattern):end_idx]
+        value = raw_value.lstrip()
+        if value:
+            # Offsets of the stripped value, so it can be sliced from the text later
+            value_start = end_idx - len(value)
+            yield start_idx, end_idx, value_start, value_start + len(value.rstrip())
+
+        start = end_idx + 1
+
+def _select_hits(hits: Iterable[_Hit], strategy: ParseStrategy, length: Callable[[_Hit], int]) -> List[_Hit]:
+    # Hits are only turned into rows once the strategy has kept them
+    if strategy == ParseStrategy.FIRST_MATCH:
+        first = next(iter(hits), None)
+        return [first] if first is not None else []
+    if strategy == ParseStrategy.LONGEST_MATCH:
+        best = None
+        for hit in hits:
+            if best is None or length(hit) > length(best):
+                best = hit
+        return [best] if best is not None else []
+    return list(hits)
+
+def _select_line_hits(
+    hits: Iterable[_Hit],
+    strategy: ParseStrategy,
+    length: Callable[[_Hit], int],
+    line_of: Callable[[_Hit], int]
+) -> List[_Hit]:
+    # Line rules apply the longest-match strategy to each line separately
+    if strategy != ParseStrategy.LONGEST_MATCH:
+        return _select_hits(hits, strategy, length)
+    selected: List[_Hit] = []
+    for _, line_hits in groupby(hits, key=line_of):
+        selected.extend(_select_hits(line_hits, strategy, length))
+    return selected
+
+def _span_length(hit: Tuple[int, int]) -> int:
+    return hit[1] - hit[0]
+
+def _keyword_length(hit: Tuple[int, int, int, int]) -> int:
+    return hit[3] - hit[2]
+
+def _regex_row(start: int, end: int, line_number: Optional[int], absolute_start: int) -> MatchRow:
+    return (start, end, line_number, absolute_start, absolute_start, absolute_start + end - start, 1.0)
+
+def _keyword_row(
+    start: int,
+    end: int,
+    line_number: Optional[int],
+    absolute_start: int,
+    value_start: int,
+    value_end: int
+) -> MatchRow:
+    # Slightly lower confidence for keyword matching
+    return (start, end, line_number, absolute_start, value_start, value_end, 0.9)
+
+def match_from_row(rule: ParseRule, row: MatchRow, text: str, offset: int = 0) -> ParseMatch:
+    start, end, line_number, absolute_start, value_start, value_end, confidence = row
+    return ParseMatch(
+        value=text[value_start - offset:value_end - offset],
+        location=ParseLocation(
+            start=start,
+            end=end,
+            line_number=line_number,
+            absolute_start=absolute_start,
+            absolute_end=absolute_start + end - start
+        ),
+        rule_name=rule.name,
+        confidence=confidence
+    )
+
+def _rule_pattern(rule: ParseRule, patterns: Optional[PatternCache] = None) -> re.Pattern:
+    return (patterns or get_pattern_cache()).compile(rule.pattern)
+
+def _scanner_fragment(
+    rule: ParseRule,
+    patterns: PatternCache,
+    multiline: bool = False
+) -> Optional[str]:
+    # Keywords are found lazily with str.find, which skips the occurrences a
+    # consumed keyword value covers instead of stopping the scan at each of them
+    if rule.mode != ParseMode.REGEX:
+        return None
+
+    try:
+        compiled = _rule_pattern(rule, patterns)
+        parsed = sre_parse.parse(rule.pattern)
+    except re.error:
+        # Keep the original error surfacing from re.finditer
+        return None
+
+    # Inline global flags, named groups and backreferences depend on the pattern
+    # standing alone, and empty matches follow finditer rules the scanner cannot emulate
+    if compiled.flags != re.UNICODE or compiled.groupindex:
+        return None
+    if parsed.getwidth()[0] == 0 or _contains_op(parsed, _is_group_reference):
+        return None
+    # Over the whole text, lookarounds and string anchors would see past the line
+    if multiline and _contains_op(parsed, _is_line_sensitive):
+        return None
+    return rule.pattern
+
+def _is_group_reference(op, argument) -> bool:
+    return op in (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS)
+
+def _is_line_sensitive(op, argument) -> bool:
+    if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return True
+    return op is sre_parse.AT and argument in (
+        sre_parse.AT_BEGINNING_STRING, sre_parse.AT_END_STRING
+    )
+
+def _contains_op(parsed, predicate) -> bool:
+    for op, argument in parsed.data:
+        if predicate(op, argument):
+            return True
+        for item in argument if isinstance(argument, (list, tuple)) else (argument,):
+            if isinstance(item, sre_parse.SubPattern) and _contains_op(item, predicate):
+                return True
+            if isinstance(item, (list, tuple)):
+                for nested in item:
+                    if isinstance(nested, sre_parse.SubPattern) and _contains_op(nested, predicate):
+                        return True
+    return False
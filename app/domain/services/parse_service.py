@@ -1,30 +1,51 @@
 # domain/services/parse_service.py
-from typing import List, Dict, Optional, Tuple
-import re
+from typing import Iterable, Iterator, List, Dict, Optional, TextIO, Tuple, Union
+from collections import OrderedDict
 import logging
+import threading
 from ..model.entities.parsing import (
     ParseRule, ParseEntry, ParsedDocument, ParseMode, 
     ParseScope, ParseStrategy
 )
-from ..model.value_objects.parse_result import ParseResult, ParseMatch, ParseMetrics, ParseLocation
+from ..model.value_objects.parse_result import ParseResult, ParseMatch, ParseMatchTable, ParseMetrics, ParseLocation
+from ..exceptions.parsing_error import InvalidParseRule
+from .compiled_rule_set import CompiledRuleSet
+from .pattern_cache import PatternCache, PatternCacheStats, get_pattern_cache
+from .regex_guard import find_catastrophic_construct
+from .stream_parser import StreamParser, DEFAULT_CHUNK_SIZE, DEFAULT_OVERLAP, DEFAULT_MAX_LINE_LENGTH
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 class ParseService:
-    def parse_text(self, text: str, rules: List[ParseRule]) -> ParseResult:
+    def __init__(
+        self,
+        max_compiled_rule_sets: int = 32,
+        pattern_cache: Optional[PatternCache] = None,
+        rule_budget: Optional[float] = None,
+        reject_unsafe_patterns: bool = True
+    ):
+        self.max_compiled_rule_sets = max_compiled_rule_sets
+        # Shared with the verifier unless a dedicated cache is given
+        self.pattern_cache = pattern_cache or get_pattern_cache()
+        # Seconds of matching allowed per rule and parse; None leaves matching unbounded
+        self.rule_budget = rule_budget
+        self.reject_unsafe_patterns = reject_unsafe_patterns
+        self._rule_sets: "OrderedDict[Tuple[ParseRule, ...], CompiledRuleSet]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse_text(self, text: str, rules: Union[List[ParseRule], CompiledRuleSet]) -> ParseResult:
         start_time = datetime.now()
-        matches: List[ParseMatch] = []
+        rule_set = rules if isinstance(rules, CompiledRuleSet) else self.compile_rules(rules)
+        matches = ParseMatchTable(text)
         rules_matched: List[str] = []
+        rule_timings: Dict[str, float] = {}
 
-        for rule in rules:
-            if rule.scope == ParseScope.LINE_BY_LINE:
-                rule_matches = self._parse_line_by_line(text, rule)
-            else:
-                rule_matches = self._parse_all_text(text, rule)
-            
-            if rule_matches:
-                matches.extend(rule_matches)
+        # All rules are matched in one traversal; results stay grouped in rule order
+        rule_rows = rule_set.match(text, budget=self.rule_budget, timings=rule_timings)
+        for rule, rows in zip(rule_set.rules, rule_rows):
+            if rows:
+                matches.extend(rule.name, rows)
                 rules_matched.append(rule.name)
 
         execution_time = (datetime.now() - start_time).total_seconds()
@@ -32,7 +53,8 @@ class ParseService:
             total_matches=len(matches),
             execution_time=execution_time,
             chars_processed=len(text),
-            rules_matched=rules_matched
+            rules_matched=rules_matched,
+            rule_timings=rule_timings
         )
 
         return ParseResult(
@@ -40,71 +62,52 @@ class ParseService:
             metrics=metrics
         )
 
-    def _parse_line_by_line(self, text: str, rule: ParseRule) -> List[ParseMatch]:
-        matches = []
-        for i, line in enumerate(text.splitlines(), 1):
-            line_matches = self._apply_rule(line, rule, line_number=i)
-            if line_matches:
-                matches.extend(line_matches)
-                if rule.strategy == ParseStrategy.FIRST_MATCH:
-                    break
-        return matches
+    def parse_stream(
+        self,
+        source: Union[Iterable[str], TextIO],
+        rules: List[ParseRule],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        overlap: int = DEFAULT_OVERLAP,
+        max_line_length: int = DEFAULT_MAX_LINE_LENGTH
+    ) -> Iterator[ParseMatch]:
+        # Matches are yielded as each chunk is parsed; matches longer than overlap may be cut
+        self.check_rules(rules)
+        parser = StreamParser(rules, chunk_size, overlap, self.pattern_cache, max_line_length)
+        return parser.parse(source)
 
-    def _parse_all_text(self, text: str, rule: ParseRule) -> List[ParseMatch]:
-        return self._apply_rule(text, rule)
+    def compile_rules(self, rules: List[ParseRule]) -> CompiledRuleSet:
+        key = tuple(rules)
+        with self._lock:
+            rule_set = self._rule_sets.get(key)
+            if rule_set is not None:
+                self._rule_sets.move_to_end(key)
+                return rule_set
 
-    def _apply_rule(self, text: str, rule: ParseRule, line_number: Optional[int] = None) -> List[ParseMatch]:
-        matches = []
-        
-        if rule.mode == ParseMode.REGEX:
-            regex_matches = list(re.finditer(rule.pattern, text))
-            for match in regex_matches:
-                location = ParseLocation(
-                    start=match.start(),
-                    end=match.end(),
-                    line_number=line_number
-                )
-                matches.append(ParseMatch(
-                    value=match.group(),
-                    location=location,
-                    rule_name=rule.name,
-                    confidence=1.0
-                ))
-        
-        elif rule.mode == ParseMode.KEYWORD:
-            start = 0
-            while True:
-                start_idx = text.find(rule.pattern, start)
-                if start_idx == -1:
-                    break
-                    
-                end_idx = len(text)
-                if rule.secondary_pattern:
-                    end_match = text.find(rule.secondary_pattern, start_idx + len(rule.pattern))
-                    if end_match != -1:
-                        end_idx = end_match
-                
-                location = ParseLocation(
-                    start=start_idx,
-                    end=end_idx,
-                    line_number=line_number
+        self.check_rules(key)
+        rule_set = CompiledRuleSet(key, self.pattern_cache)
+        if rule_set.fallback_rules:
+            logger.debug(f"Rules matched separately from the combined scanner: {rule_set.fallback_rules}")
+
+        with self._lock:
+            self._rule_sets[key] = rule_set
+            while len(self._rule_sets) > self.max_compiled_rule_sets:
+                self._rule_sets.popitem(last=False)
+        return rule_set
+
+    def check_rules(self, rules: Iterable[ParseRule]) -> None:
+        # Patterns known to backtrack exponentially are refused before they ever run
+        if not self.reject_unsafe_patterns:
+            return
+        for rule in rules:
+            if rule.mode != ParseMode.REGEX:
+                continue
+            problem = find_catastrophic_construct(rule.pattern)
+            if problem:
+                raise InvalidParseRule(
+                    rule.name,
+                    f"Pattern may backtrack catastrophically: {problem}",
+                    details={"pattern": rule.pattern}
                 )
-                
-                value = text[start_idx + len(rule.pattern):end_idx].strip()
-                if value:
-                    matches.append(ParseMatch(
-                        value=value,
-                        location=location,
-                        rule_name=rule.name,
-                        confidence=0.9  # Slightly lower confidence for keyword matching
-                    ))
-                
-                start = end_idx + 1
 
-        # Apply strategy
-        if matches and rule.strategy == ParseStrategy.FIRST_MATCH:
-            return [matches[0]]
-        elif matches and rule.strategy == ParseStrategy.LONGEST_MATCH:
-            return [max(matches, key=lambda m: len(m.value))]
-        
-        return matches
\ No newline at end of file
+    def pattern_cache_stats(self) -> PatternCacheStats:
+        return self.pattern_cache.stats()
@@ -0,0 +1,87 @@
+# domain/services/pattern_cache.py
+from typing import Pattern, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+import re
+import threading
+
+DEFAULT_PATTERN_CACHE_SIZE = 512
+
+@dataclass(frozen=True)
+class PatternCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+class PatternCache:
+    """Bounded LRU of compiled regular expressions, keyed by pattern and flags."""
+
+    def __init__(self, max_size: int = DEFAULT_PATTERN_CACHE_SIZE):
+        if max_size < 1:
+            raise ValueError("Pattern cache size must be at least 1")
+        self.max_size = max_size
+        self._patterns: "OrderedDict[Tuple[str, int], Pattern]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def compile(self, pattern: str, flags: int = 0) -> Pattern:
+        key = (pattern, int(flags))
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self._patterns.move_to_end(key)
+                self._hits += 1
+                return compiled
+            self._misses += 1
+
+        # Compiling outside the lock; invalid patterns raise re.error as usual
+        compiled = re.compile(pattern, flags)
+
+        with self._lock:
+            self._patterns[key] = compiled
+            self._patterns.move_to_end(key)
+            while len(self._patterns) > self.max_size:
+                self._patterns.popitem(last=False)
+                self._evictions += 1
+        return compiled
+
+    def resize(self, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError("Pattern cache size must be at least 1")
+        with self._lock:
+            self.max_size = max_size
+            while len(self._patterns) > self.max_size:
+                self._patterns.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._patterns.clear()
+
+    def stats(self) -> PatternCacheStats:
+        with self._lock:
+            return PatternCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._patterns),
+                max_size=self.max_size
+            )
+
+# Shared by the parse and verification services unless they are given their own
+_shared_cache = PatternCache()
+
+def get_pattern_cache() -> PatternCache:
+    return _shared_cache
+
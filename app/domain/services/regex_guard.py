@@ -0,0 +1,197 @@
+# domain/services/regex_guard.py
+from typing import Callable, Iterator, List, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+import logging
+import re
+import signal
+import string
+import threading
+import time
+try:
+    from re import _parser as sre_parse, _compiler as sre_compile
+except ImportError:  # Python < 3.11
+    import sre_parse, sre_compile
+
+logger = logging.getLogger(__name__)
+
+_REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+_ASSERTIONS = (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT)
+# Bounded repetitions this large backtrack as badly as unbounded ones
+_LARGE_REPEAT = 10
+# Characters used to decide whether two single-character items can match the same input
+_SAMPLE_CHARACTERS = string.printable + "\u00e9\u00df\u0416\u4e2d\u0663\u00a0\u2003"
+
+# Services check a pattern every time they compile it, so the verdicts are kept
+@lru_cache(maxsize=512)
+def find_catastrophic_construct(pattern: str) -> Optional[str]:
+    """Returns a description of the first construct in pattern known to backtrack
+    exponentially, or None when none is found.
+
+    A repeated group is ambiguous, and can be split into iterations in exponentially
+    many ways before a match fails, when its body is a variable repetition with
+    only optional surroundings ((a+)+, (\\w+\\s?)*), holds a variable repetition
+    followed by characters it can also match ((x+x+)+, (.*a){20}), or alternates
+    between branches that hold a quantifier or overlap ((a+|b)+, (a|aa)+). Groups
+    repeated without bound or at least _LARGE_REPEAT times are examined.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        # Syntax errors are reported where the pattern is compiled
+        return None
+    return _scan(parsed, parsed.state)
+
+def _scan(subpattern, state) -> Optional[str]:
+    for op, argument in subpattern.data:
+        if op in _REPEATS:
+            low, high, body = argument
+            if high == sre_parse.MAXREPEAT or high >= _LARGE_REPEAT:
+                problem = _ambiguous_body(_flatten(body), state)
+                if problem:
+                    return problem
+            found = _scan(body, state)
+        elif op is sre_parse.SUBPATTERN:
+            found = _scan(argument[-1], state)
+        elif op is sre_parse.BRANCH:
+            found = next(filter(None, (_scan(branch, state) for branch in argument[1])), None)
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            found = _scan(argument[1], state)
+        elif op is sre_parse.GROUPREF_EXISTS:
+            found = next(filter(None, (_scan(branch, state) for branch in argument[1:] if branch)), None)
+        elif getattr(sre_parse, "ATOMIC_GROUP", None) is op:
+            found = _scan(argument, state)
+        elif getattr(sre_parse, "POSSESSIVE_REPEAT", None) is op:
+            # Possessive repetitions never give back what they matched
+            found = _scan(argument[2], state)
+        else:
+            found = None
+        if found:
+            return found
+    return None
+
+def _flatten(subpattern) -> List:
+    # Plain groups do not change how a sequence backtracks
+    items = []
+    for op, argument in subpattern.data:
+        if op is sre_parse.SUBPATTERN:
+            items.extend(_flatten(argument[-1]))
+        else:
+            items.append((op, argument))
+    return items
+
+def _ambiguous_body(items: List, state) -> Optional[str]:
+    widths = [_min_width(item, state) for item in items]
+    variable = [
+        position for position, (op, argument) in enumerate(items)
+        if op in _REPEATS and argument[1] > argument[0]
+    ]
+
+    for position in variable:
+        if all(width == 0 for other, width in enumerate(widths) if other != position):
+            return "nested quantifier inside a large repetition"
+
+    for position in variable:
+        # The next iteration starts over at the front of the body
+        for following in (items[position + 1:] + items[:position])[:len(items) - 1]:
+            op, argument = following
+            # An optional item would match the empty string before any character
+            following_body = argument[2] if op in _REPEATS else sre_parse.SubPattern(state, [following])
+            if op not in _ASSERTIONS and _overlaps(items[position][1][2], following_body, state):
+                return "repetition followed by characters it also matches inside a large repetition"
+            if _min_width(following, state) > 0:
+                break
+
+    for op, argument in items:
+        if op is sre_parse.BRANCH:
+            branches = argument[1]
+            # The parser moves a prefix shared by all branches out of the alternation,
+            # so (a|aa) arrives here as a(?:|a)
+            if any(branch.getwidth()[0] == 0 for branch in branches):
+                return "alternation with branches matching the same text inside a large repetition"
+            if any(_has_quantifier(branch) for branch in branches):
+                return "alternation with a quantified branch inside a large repetition"
+            leading = [_leading_characters(branch, state) for branch in branches]
+            for first in range(len(leading)):
+                if any(leading[first] & other for other in leading[first + 1:]):
+                    return "alternation with branches matching the same text inside a large repetition"
+    return None
+
+def _has_quantifier(subpattern) -> bool:
+    for op, argument in subpattern.data:
+        if op in _REPEATS:
+            if argument[1] > argument[0] or _has_quantifier(argument[2]):
+                return True
+        elif op is sre_parse.SUBPATTERN:
+            if _has_quantifier(argument[-1]):
+                return True
+        elif op is sre_parse.BRANCH:
+            if any(_has_quantifier(branch) for branch in argument[1]):
+                return True
+    return False
+
+def _min_width(item, state) -> int:
+    return sre_parse.SubPattern(state, [item]).getwidth()[0]
+
+def _overlaps(first, second, state) -> bool:
+    first_characters = _leading_characters(first, state)
+    second_characters = _leading_characters(second, state)
+    return bool(first_characters & second_characters)
+
+def _leading_characters(body, state) -> set:
+    if not body.data:
+        return set()
+    try:
+        compiled = sre_compile.compile(sre_parse.SubPattern(state, [body.data[0]]), state.flags)
+    except Exception:
+        # Treat anything that cannot stand alone as able to match anything
+        return set(_SAMPLE_CHARACTERS)
+    return {character for character in _SAMPLE_CHARACTERS if compiled.match(character)}
+
+class _BudgetExceeded(BaseException):
+    pass
+
+@contextmanager
+def regex_budget(seconds: Optional[float], on_exceeded: Callable[[float], Exception]) -> Iterator[None]:
+    """Bounds the time spent in the enclosed regex matching.
+
+    On the main thread of a platform with SIGALRM, the matching is interrupted once
+    the budget runs out. Elsewhere it cannot be interrupted, so the overrun is only
+    reported when the matching returns. Either way the error from on_exceeded is raised.
+    """
+    if seconds is None:
+        yield
+        return
+
+    interruptible = (
+        hasattr(signal, "SIGALRM")
+        and threading.current_thread() is threading.main_thread()
+        and signal.getitimer(signal.ITIMER_REAL)[0] == 0
+        and signal.getsignal(signal.SIGALRM) in (signal.SIG_DFL, signal.SIG_IGN, None)
+    )
+    previous_handler = None
+    active = [True]
+    if interruptible:
+        def interrupt(signum, frame):
+            # A signal landing after the matching finished must not raise
+            if active[0]:
+                raise _BudgetExceeded()
+        previous_handler = signal.signal(signal.SIGALRM, interrupt)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+
+    start = time.perf_counter()
+    try:
+        try:
+            yield
+        finally:
+            active[0] = False
+    except _BudgetExceeded:
+        raise on_exceeded(time.perf_counter() - start) from None
+    finally:
+        if interruptible:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    elapsed = time.perf_counter() - start
+    if elapsed > seconds:
+        raise on_exceeded(elapsed)
@@ -0,0 +1,207 @@
+# domain/services/stream_parser.py
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+from dataclasses import dataclass
+import logging
+from ..model.entities.parsing import ParseRule, ParseMode, ParseScope, ParseStrategy
+from ..model.value_objects.parse_result import ParseMatch, ParseLocation
+from .compiled_rule_set import CompiledRuleSet, match_from_row
+from .pattern_cache import PatternCache, get_pattern_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_OVERLAP = 4 * 1024
+DEFAULT_MAX_LINE_LENGTH = 1024 * 1024
+
+@dataclass
+class _TextRuleState:
+    rule: ParseRule
+    # Absolute offset the rule's next search starts from
+    resume: int = 0
+    done: bool = False
+    best: Optional[ParseMatch] = None
+
+class StreamParser:
+    """Parses a document read in chunks, yielding matches as they are found.
+
+    Text rules scan a window that always extends `overlap` characters past the
+    part being reported, so a match starting before a chunk boundary is still
+    seen whole as long as it is no longer than the overlap. A keyword is held,
+    with the text after it, until its end marker is read or the source ends, so
+    keyword values match exactly as in ParseService.parse_text. Line rules only
+    ever see complete lines and match exactly as well, except on lines longer than
+    max_line_length: those are matched in pieces, so the unread part of a line
+    is never buffered without bound. Longest-match text rules report their single
+    match once the source ends.
+    """
+
+    def __init__(
+        self,
+        rules: List[ParseRule],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        overlap: int = DEFAULT_OVERLAP,
+        patterns: Optional[PatternCache] = None,
+        max_line_length: int = DEFAULT_MAX_LINE_LENGTH
+    ):
+        if chunk_size < 1 or overlap < 1 or max_line_length < 1:
+            raise ValueError("chunk_size, overlap and max_line_length must be positive")
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.max_line_length = max_line_length
+        self.patterns = patterns or get_pattern_cache()
+        self._text_rules = [rule for rule in rules if rule.scope != ParseScope.LINE_BY_LINE]
+        self._line_rules = [rule for rule in rules if rule.scope == ParseScope.LINE_BY_LINE]
+        self._line_set = CompiledRuleSet(self._line_rules, self.patterns) if self._line_rules else None
+
+    def parse(self, source: Union[Iterable[str], TextIO]) -> Iterator[ParseMatch]:
+        text_rules = [_TextRuleState(rule) for rule in self._text_rules]
+        line_rules = list(self._line_rules)
+        line_set = self._line_set
+        buffer = ""
+        buffer_start = 0
+        # Line rules have consumed the text up to here, always a line boundary
+        line_position = 0
+        lines_done = 0
+
+        chunks = _read_chunks(source, self.chunk_size)
+        final = False
+        while not final:
+            if line_set is None and all(state.done for state in text_rules):
+                # Every rule already has its first match; the rest of the source is not read
+                break
+            pending = [buffer]
+            size = 0
+            while size < self.chunk_size:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    final = True
+                    break
+                pending.append(chunk)
+                size += len(chunk)
+            buffer = "".join(pending)
+            buffer_end = buffer_start + len(buffer)
+            cutoff = buffer_end if final else buffer_end - self.overlap
+
+            for state in text_rules:
+                if not state.done:
+                    yield from self._scan_text_rule(state, buffer, buffer_start, cutoff, final)
+
+            if line_set is not None:
+                relative = line_position - buffer_start
+                block_end = len(buffer) if final else buffer.rfind("\n", relative) + 1
+                if block_end <= relative and len(buffer) - relative > self.max_line_length:
+                    # A line this long is matched in pieces rather than held until it ends
+                    block_end = len(buffer)
+                if block_end > relative:
+                    block = buffer[relative:block_end]
+                    finished = []
+                    for rule, rows in zip(line_set.rules, line_set.match(block, line_position, lines_done + 1)):
+                        for row in rows:
+                            yield match_from_row(rule, row, block, line_position)
+                        if rows and rule.strategy == ParseStrategy.FIRST_MATCH:
+                            finished.append(rule)
+                    if finished:
+                        # Rules that found their first match take no part in later blocks
+                        line_rules = [rule for rule in line_rules if rule not in finished]
+                        line_set = CompiledRuleSet(line_rules, self.patterns) if line_rules else None
+                    lines = block.splitlines(True)
+                    # A piece of a long line leaves its line unfinished for the next block
+                    lines_done += len(lines) - (lines[-1] == lines[-1].splitlines()[0])
+                    line_position = buffer_start + block_end
+
+            # Keep the overlap before the cutoff as context for anchors and lookbehinds
+            keep_from = cutoff - self.overlap
+            if line_set is not None:
+                keep_from = min(keep_from, line_position)
+            for state in text_rules:
+                if not state.done:
+                    # Held keywords resume before the cutoff
+                    keep_from = min(keep_from, state.resume)
+            keep_from = max(buffer_start, keep_from)
+            buffer = buffer[keep_from - buffer_start:]
+            buffer_start = keep_from
+
+        for state in text_rules:
+            if state.best is not None:
+                yield state.best
+
+    def _scan_text_rule(
+        self,
+        state: _TextRuleState,
+        buffer: str,
+        buffer_start: int,
+        cutoff: int,
+        final: bool
+    ) -> Iterator[ParseMatch]:
+        rule = state.rule
+        limit = cutoff - buffer_start
+        hits = self._text_hits(rule, buffer, state.resume - buffer_start, limit, final)
+        for start, end, value, next_position in hits:
+            state.resume = buffer_start + next_position
+            if value is None:
+                # The keyword's value may go on past this window; it is matched again
+                # from the keyword once more text is read
+                return
+            match = ParseMatch(
+                value=value,
+                location=ParseLocation(
+                    start=buffer_start + start,
+                    end=buffer_start + end,
+                    absolute_start=buffer_start + start,
+                    absolute_end=buffer_start + end
+                ),
+                rule_name=rule.name,
+                confidence=1.0 if rule.mode == ParseMode.REGEX else 0.9
+            )
+            if rule.strategy == ParseStrategy.FIRST_MATCH:
+                state.done = True
+                yield match
+                return
+            if rule.strategy == ParseStrategy.LONGEST_MATCH:
+                if state.best is None or len(value) > len(state.best.value):
+                    state.best = match
+                continue
+            yield match
+
+        if not final:
+            # Nothing else starts before the cutoff; the next window resumes there
+            state.resume = max(state.resume, cutoff)
+
+    def _text_hits(
+        self,
+        rule: ParseRule,
+        buffer: str,
+        position: int,
+        limit: int,
+        final: bool
+    ) -> Iterator[Tuple[int, int, Optional[str], int]]:
+        if rule.mode == ParseMode.REGEX:
+            pattern = self.patterns.compile(rule.pattern)
+            for found in pattern.finditer(buffer, position):
+                if not final and found.start() >= limit:
+                    return
+                # An empty match is not repeated at the same position
+                next_position = found.end() if found.end() > found.start() else found.end() + 1
+                yield found.start(), found.end(), found.group(), next_position
+        elif rule.mode == ParseMode.KEYWORD:
+            while True:
+                start_idx = buffer.find(rule.pattern, position)
+                if start_idx == -1 or (not final and start_idx >= limit):
+                    return
+                end_idx = len(buffer)
+                if rule.secondary_pattern:
+                    end_match = buffer.find(rule.secondary_pattern, start_idx + len(rule.pattern))
+                    if end_match != -1:
+                        end_idx = end_match
+                if end_idx == len(buffer) and not final:
+                    yield start_idx, end_idx, None, start_idx
+                    return
+                value = buffer[start_idx + len(rule.pattern):end_idx].strip()
+                if value:
+                    yield start_idx, end_idx, value, end_idx + 1
+                position = end_idx + 1
+
+def _read_chunks(source: Union[Iterable[str], TextIO], chunk_size: int) -> Iterator[str]:
+    if hasattr(source, "read"):
+        return iter(lambda: source.read(chunk_size), "")
+    return (chunk for chunk in source if chunk)
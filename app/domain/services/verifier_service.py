@@ -1,52 +1,244 @@
 # domain/services/verifier_service.py
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple, Union
+from dataclasses import dataclass, replace
 import logging
-from datetime import datetime
+import math
+import numpy as np
+import re
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Executor, Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+import hashlib
 from ..model.entities.verification import (
     VerificationMethod, VerificationMethodType, VerificationMode,
-    VerificationResult, VerificationSummary
+    VerificationResult, VerificationSummary, ConsensusMode, VerificationExecutionMode
 )
 from ..model.value_objects.verification_status import VerificationStatus
-from ..model.value_objects.similarity_score import SimilarityScore
+from ..model.entities.verification_plan import PlannedVerification, VerificationPlan
+from ..model.entities.generation import GeneratedResult
+from ..model.entities.method_statistics import (
+    MethodStatistics, method_statistics_key, method_fingerprint, function_fingerprint
+)
+from ..model.value_objects.similarity_score import SimilarityScore, cosine_similarity
 from ..ports.embeddings_port import EmbeddingsPort
 from ..ports.llm_port import LLMPort
+from ..ports.statistics_port import MethodStatisticsPort
+from ..ports.cache_port import CachePort
+from ..ports.function_executor_port import FunctionExecutorPort
+from .pattern_cache import PatternCache, PatternCacheStats, get_pattern_cache
+from .regex_guard import find_catastrophic_construct, regex_budget
+from ..exceptions.verification_error import InvalidVerificationMethod, VerificationExecutionError
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class _CascadeCounters:
+    evaluations: int = 0
+    escalations: int = 0
+    consensus_time: float = 0.0
+    time_saved: float = 0.0
+
 class VerifierService:
-    def __init__(self, embeddings: EmbeddingsPort, llm: LLMPort):
+    def __init__(
+        self,
+        embeddings: EmbeddingsPort,
+        llm: LLMPort,
+        statistics: Optional[MethodStatisticsPort] = None,
+        executor: Optional[Executor] = None,
+        max_concurrent_methods: int = 4,
+        cache: Optional[CachePort] = None,
+        cache_ttl: Optional[timedelta] = None,
+        cache_sampled_consensus: bool = True,
+        function_executor: Optional[FunctionExecutorPort] = None,
+        pattern_cache: Optional[PatternCache] = None,
+        regex_time_budget: Optional[float] = None
+    ):
         self.embeddings = embeddings
         self.llm = llm
+        self.statistics = statistics
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        # Sampled consensus votes vary between runs; caching them freezes one draw
+        self.cache_sampled_consensus = cache_sampled_consensus
+        # Runs custom verification functions off the calling thread, when provided
+        self.function_executor = function_executor
+        # Shared with the parser unless a dedicated cache is given
+        self.pattern_cache = pattern_cache or get_pattern_cache()
+        # Seconds a regex method may spend on one text; None leaves matching unbounded
+        self.regex_time_budget = regex_time_budget
+        self.max_concurrent_methods = max_concurrent_methods
+        # A pool is only created on the first concurrent verification, unless one is given
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
+        self.CONSENSUS_VOTES = 5
+        # Relative cost of each method type; cheaper methods run first when cost-ordered
+        self.METHOD_COSTS = {
+            VerificationMethodType.REGEX: 0,
+            VerificationMethodType.CUSTOM: 1,
+            VerificationMethodType.EMBEDDING: 2,
+            VerificationMethodType.CASCADE: 3,
+            VerificationMethodType.CONSENSUS: 4
+        }
+        # Assumed latency in seconds of methods that have not been observed yet
+        self.LATENCY_PRIORS = {
+            VerificationMethodType.REGEX: 0.0001,
+            VerificationMethodType.CUSTOM: 0.001,
+            VerificationMethodType.EMBEDDING: 0.05,
+            VerificationMethodType.CASCADE: 0.3,
+            VerificationMethodType.CONSENSUS: 1.0
+        }
+
+        self._statistics_lock = threading.Lock()
+        self._cascade_counters: Dict[str, _CascadeCounters] = {}
+        self._method_statistics: Dict[str, MethodStatistics] = {}
+        if statistics is not None:
+            for entry in statistics.load():
+                self._method_statistics[entry.method_key] = entry
 
     def verify_text(
         self,
         text: str,
-        methods: List[VerificationMethod],
+        methods: Union[List[VerificationMethod], VerificationPlan],
         required_for_confirmed: int,
-        required_for_review: int
+        required_for_review: int,
+        execution_mode: VerificationExecutionMode = VerificationExecutionMode.SEQUENTIAL,
+        timeout: Optional[float] = None
     ) -> VerificationSummary:
+        # Every method and model call is bounded by what is left of this budget
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        if execution_mode == VerificationExecutionMode.COST_ORDERED:
+            return self._verify_text_ordered(
+                text,
+                self._cost_order(self._plan_steps(methods)),
+                required_for_confirmed,
+                required_for_review,
+                deadline
+            )
+
+        if execution_mode == VerificationExecutionMode.CONCURRENT:
+            return self._verify_text_concurrent(
+                text,
+                self._plan_steps(methods),
+                required_for_confirmed,
+                required_for_review,
+                deadline
+            )
+
+        if execution_mode == VerificationExecutionMode.ADAPTIVE:
+            return self._verify_text_ordered(
+                text,
+                self._adaptive_order(self._plan_steps(methods)),
+                required_for_confirmed,
+                required_for_review,
+                deadline
+            )
+
         start_time = datetime.now()
         results: List[VerificationResult] = []
+        observations: List[Tuple[VerificationMethod, bool, bool, float]] = []
         cumulative_passes = 0
+        steps = self._plan_steps(methods)
 
-        for method in methods:
-            result = self._apply_verification_method(method, text)
+        for index, step in enumerate(steps):
+            if self._deadline_exceeded(deadline):
+                final_status = VerificationStatus.TIMEOUT
+                break
+
+            method = step.method
+            started = time.perf_counter()
+            result = self._apply_verification_method(method, text, step, deadline)
+            latency = time.perf_counter() - started
             results.append(result)
 
+            # Model calls stop at the deadline, so a late result may be truncated
+            if self._deadline_exceeded(deadline):
+                self._observe(observations, method, result, False, latency)
+                final_status = VerificationStatus.TIMEOUT
+                break
+
             if not result.passed and method.mode == VerificationMode.ELIMINATORY:
+                self._observe(observations, method, result, True, latency)
                 final_status = VerificationStatus.DISCARDED
                 break
             
             if result.passed and method.mode == VerificationMode.CUMULATIVE:
                 cumulative_passes += 1
 
+            decisive = self._decided_status(
+                cumulative_passes, steps[index + 1:], required_for_confirmed, required_for_review
+            ) is not None
+            self._observe(observations, method, result, decisive, latency)
+
         else:  # Only executed if no break occurred
-            if cumulative_passes >= required_for_confirmed:
-                final_status = VerificationStatus.CONFIRMED
-            elif cumulative_passes >= required_for_review:
-                final_status = VerificationStatus.REVIEW
-            else:
+            final_status = self._cumulative_status(
+                cumulative_passes, required_for_confirmed, required_for_review
+            )
+
+        self._record_statistics(observations)
+        if final_status == VerificationStatus.TIMEOUT:
+            results.extend(self._skipped_result(step, final_status) for step in steps[len(results):])
+        verification_time = (datetime.now() - start_time).total_seconds()
+
+        return VerificationSummary(
+            results=results,
+            final_status=final_status.value,
+            verification_time=verification_time
+        )
+
+    def _verify_text_ordered(
+        self,
+        text: str,
+        pending: List[PlannedVerification],
+        required_for_confirmed: int,
+        required_for_review: int,
+        deadline: Optional[float] = None
+    ) -> VerificationSummary:
+        start_time = datetime.now()
+        results: List[VerificationResult] = []
+        observations: List[Tuple[VerificationMethod, bool, bool, float]] = []
+        cumulative_passes = 0
+        final_status: Optional[VerificationStatus] = None
+
+        while pending:
+            if self._deadline_exceeded(deadline):
+                final_status = VerificationStatus.TIMEOUT
+                break
+
+            step = pending.pop(0)
+            method = step.method
+            started = time.perf_counter()
+            result = self._apply_verification_method(method, text, step, deadline)
+            latency = time.perf_counter() - started
+            results.append(result)
+
+            if self._deadline_exceeded(deadline):
+                self._observe(observations, method, result, False, latency)
+                final_status = VerificationStatus.TIMEOUT
+                break
+
+            if not result.passed and method.mode == VerificationMode.ELIMINATORY:
                 final_status = VerificationStatus.DISCARDED
+            else:
+                if result.passed and method.mode == VerificationMode.CUMULATIVE:
+                    cumulative_passes += 1
+                final_status = self._decided_status(
+                    cumulative_passes, pending, required_for_confirmed, required_for_review
+                )
+
+            self._observe(observations, method, result, final_status is not None, latency)
+            if final_status is not None:
+                break
+
+        self._record_statistics(observations)
+        results.extend(self._skipped_result(step, final_status) for step in pending)
+
+        if final_status is None:
+            final_status = self._cumulative_status(
+                cumulative_passes, required_for_confirmed, required_for_review
+            )
 
         verification_time = (datetime.now() - start_time).total_seconds()
 
@@ -56,35 +248,622 @@ class VerifierService:
             verification_time=verification_time
         )
 
+    def _verify_text_concurrent(
+        self,
+        text: str,
+        steps: Tuple[PlannedVerification, ...],
+        required_for_confirmed: int,
+        required_for_review: int,
+        deadline: Optional[float] = None
+    ) -> VerificationSummary:
+        start_time = datetime.now()
+        executor = self._get_executor()
+        results: Dict[int, VerificationResult] = {}
+        observations: List[Tuple[VerificationMethod, bool, bool, float]] = []
+        cumulative_passes = 0
+        final_status: Optional[VerificationStatus] = None
+
+        futures: Dict[Future, int] = {
+            executor.submit(self._timed_verification, step, text, deadline): index
+            for index, step in enumerate(steps)
+        }
+        outstanding = set(futures)
+
+        try:
+            while outstanding and final_status is None:
+                done, outstanding = wait(
+                    outstanding,
+                    timeout=self._remaining_time(deadline),
+                    return_when=FIRST_COMPLETED
+                )
+                if self._deadline_exceeded(deadline):
+                    # Late results may be truncated and are dropped with the rest
+                    outstanding |= done
+                    final_status = VerificationStatus.TIMEOUT
+                    break
+                unprocessed = set(done)
+                for future in done:
+                    unprocessed.discard(future)
+                    index = futures[future]
+                    method = steps[index].method
+                    result, latency = future.result()
+                    results[index] = result
+
+                    # Results that finished together are all kept, but only the first
+                    # one to settle the status counts as decisive
+                    decided_before = final_status is not None
+                    if not result.passed and method.mode == VerificationMode.ELIMINATORY:
+                        final_status = final_status or VerificationStatus.DISCARDED
+                    else:
+                        if result.passed and method.mode == VerificationMode.CUMULATIVE:
+                            cumulative_passes += 1
+                        if not decided_before:
+                            final_status = self._decided_status(
+                                cumulative_passes,
+                                [steps[futures[f]] for f in outstanding | unprocessed],
+                                required_for_confirmed,
+                                required_for_review
+                            )
+
+                    self._observe(
+                        observations, method, result, not decided_before and final_status is not None, latency
+                    )
+        finally:
+            # Methods already running cannot be interrupted; their results are ignored
+            for future in outstanding:
+                future.cancel()
+
+        self._record_statistics(observations)
+
+        if final_status is None:
+            final_status = self._cumulative_status(
+                cumulative_passes, required_for_confirmed, required_for_review
+            )
+
+        for index, step in enumerate(steps):
+            if index not in results:
+                results[index] = self._skipped_result(step, final_status)
+
+        verification_time = (datetime.now() - start_time).total_seconds()
+
+        # Results are reported in method order regardless of completion order
+        return VerificationSummary(
+            results=[results[index] for index in range(len(steps))],
+            final_status=final_status.value,
+            verification_time=verification_time
+        )
+
+    def _timed_verification(
+        self,
+        step: PlannedVerification,
+        text: str,
+        deadline: Optional[float] = None
+    ) -> Tuple[VerificationResult, float]:
+        started = time.perf_counter()
+        result = self._apply_verification_method(step.method, text, step, deadline)
+        return result, time.perf_counter() - started
+
+    def _skipped_result(
+        self,
+        step: PlannedVerification,
+        final_status: VerificationStatus
+    ) -> VerificationResult:
+        if final_status == VerificationStatus.TIMEOUT:
+            reason = "verification deadline exceeded"
+        else:
+            reason = f"status already determined as {final_status.value}"
+        return VerificationResult(
+            method=step.method,
+            passed=False,
+            skipped=True,
+            details={"skip_reason": reason}
+        )
+
+    def _get_executor(self) -> Executor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_methods,
+                    thread_name_prefix="verifier"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None and self._owns_executor:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+        if self.statistics is not None:
+            self.statistics.flush()
+
+    def _cost_order(self, steps: Tuple[PlannedVerification, ...]) -> List[PlannedVerification]:
+        # Cheapest first; at equal cost, eliminatory checks go first since one
+        # failure settles the status
+        return sorted(
+            steps,
+            key=lambda step: (
+                self.METHOD_COSTS.get(step.method.method_type, len(self.METHOD_COSTS)),
+                step.method.mode != VerificationMode.ELIMINATORY
+            )
+        )
+
+    def _adaptive_order(self, steps: Tuple[PlannedVerification, ...]) -> List[PlannedVerification]:
+        with self._statistics_lock:
+            statistics = {
+                id(step): self._method_statistics.get(method_statistics_key(step.method))
+                for step in steps
+            }
+
+        # Run first the methods that settle the status most often per second spent:
+        # for eliminatory checks that is their failure rate, for cumulative ones
+        # how often they were decisive. Estimates are smoothed so unseen methods
+        # start from the type's latency prior and an even chance
+        def expected_cost(step: PlannedVerification) -> Tuple[float, bool]:
+            method = step.method
+            entry = statistics[id(step)]
+            prior_latency = self.LATENCY_PRIORS.get(method.method_type, 1.0)
+            executions = entry.executions if entry else 0
+
+            latency = ((entry.total_latency if entry else 0.0) + prior_latency) / (executions + 1)
+            if method.mode == VerificationMode.ELIMINATORY:
+                settled = executions - (entry.passes if entry else 0)
+            else:
+                settled = entry.decisive if entry else 0
+            settle_probability = (settled + 1) / (executions + 2)
+
+            return (latency / settle_probability, method.mode != VerificationMode.ELIMINATORY)
+
+        return sorted(steps, key=expected_cost)
+
+    def pattern_cache_stats(self) -> PatternCacheStats:
+        return self.pattern_cache.stats()
+
+    def method_statistics(self) -> List[MethodStatistics]:
+        with self._statistics_lock:
+            return list(self._method_statistics.values())
+
+    def _observe(
+        self,
+        observations: List[Tuple[VerificationMethod, bool, bool, float]],
+        method: VerificationMethod,
+        result: VerificationResult,
+        decisive: bool,
+        latency: float
+    ) -> None:
+        # A cache hit costs next to nothing and would skew the latencies ADAPTIVE ordering relies on
+        if (result.details or {}).get("cache_hit"):
+            return
+        observations.append((method, result.passed, decisive, latency))
+
+    def _record_statistics(self, observations: List[Tuple[VerificationMethod, bool, bool, float]]) -> None:
+        updated: Dict[str, MethodStatistics] = {}
+        with self._statistics_lock:
+            for method, passed, decisive, latency in observations:
+                key = method_statistics_key(method)
+                entry = self._method_statistics.get(key) or MethodStatistics(
+                    method_key=key,
+                    method_name=method.name,
+                    method_type=method.method_type
+                )
+                entry = entry.record(passed, decisive, latency)
+                self._method_statistics[key] = entry
+                updated[key] = entry
+
+        if self.statistics is not None and updated:
+            try:
+                self.statistics.save(list(updated.values()))
+            except Exception as e:
+                # Losing statistics must never fail a verification
+                logger.warning(f"Could not persist method statistics: {str(e)}")
+
+    def _decided_status(
+        self,
+        cumulative_passes: int,
+        pending: List[PlannedVerification],
+        required_for_confirmed: int,
+        required_for_review: int
+    ) -> Optional[VerificationStatus]:
+        remaining_cumulative = sum(
+            1 for step in pending if step.method.mode == VerificationMode.CUMULATIVE
+        )
+        best_case = cumulative_passes + remaining_cumulative
+
+        # Too few cumulative checks left to reach review: discarded whatever happens
+        if best_case < required_for_review:
+            return VerificationStatus.DISCARDED
+
+        # Otherwise a pending eliminatory check could still discard the text
+        if any(step.method.mode == VerificationMode.ELIMINATORY for step in pending):
+            return None
+
+        best_status = self._cumulative_status(best_case, required_for_confirmed, required_for_review)
+        worst_status = self._cumulative_status(cumulative_passes, required_for_confirmed, required_for_review)
+        if best_status == worst_status:
+            return worst_status
+        return None
+
+    def verify_texts(
+        self,
+        texts: List[str],
+        methods: Union[List[VerificationMethod], VerificationPlan],
+        required_for_confirmed: int,
+        required_for_review: int,
+        timeout: Optional[float] = None
+    ) -> List[VerificationSummary]:
+        start_time = datetime.now()
+        # The budget covers the whole batch, since every text advances together
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        results: List[List[VerificationResult]] = [[] for _ in texts]
+        cumulative_passes = [0] * len(texts)
+        discarded = [False] * len(texts)
+        timed_out = [False] * len(texts)
+        candidate_embeddings: Dict[str, List[float]] = {}
+        steps = self._plan_steps(methods)
+
+        # Each method runs once over every text that is still in play, so model-backed
+        # methods get one batched call instead of one call per text
+        for position, step in enumerate(steps):
+            method = step.method
+            active = [i for i in range(len(texts)) if not discarded[i]]
+            if not active:
+                break
+
+            if self._deadline_exceeded(deadline):
+                for i in active:
+                    timed_out[i] = True
+                    results[i].extend(
+                        self._skipped_result(skipped, VerificationStatus.TIMEOUT)
+                        for skipped in steps[position:]
+                    )
+                break
+
+            step_results = self._apply_verification_method_batch(
+                step, [texts[i] for i in active], candidate_embeddings, deadline
+            )
+
+            # Model calls stop at the deadline, so late results may be truncated and
+            # neither eliminate nor count for a text
+            if self._deadline_exceeded(deadline):
+                for i, result in zip(active, step_results):
+                    timed_out[i] = True
+                    results[i].append(result)
+                    results[i].extend(
+                        self._skipped_result(skipped, VerificationStatus.TIMEOUT)
+                        for skipped in steps[position + 1:]
+                    )
+                break
+
+            for i, result in zip(active, step_results):
+                results[i].append(result)
+                if not result.passed and method.mode == VerificationMode.ELIMINATORY:
+                    discarded[i] = True
+                elif result.passed and method.mode == VerificationMode.CUMULATIVE:
+                    cumulative_passes[i] += 1
+
+        # Texts share the batched calls, so each one is charged an equal share of the time
+        verification_time = (datetime.now() - start_time).total_seconds() / max(len(texts), 1)
+
+        summaries = []
+        for i in range(len(texts)):
+            if timed_out[i]:
+                final_status = VerificationStatus.TIMEOUT
+            elif discarded[i]:
+                final_status = VerificationStatus.DISCARDED
+            else:
+                final_status = self._cumulative_status(
+                    cumulative_passes[i], required_for_confirmed, required_for_review
+                )
+            summaries.append(VerificationSummary(
+                results=results[i],
+                final_status=final_status.value,
+                verification_time=verification_time
+            ))
+
+        return summaries
+
+    def _cumulative_status(
+        self,
+        cumulative_passes: int,
+        required_for_confirmed: int,
+        required_for_review: int
+    ) -> VerificationStatus:
+        if cumulative_passes >= required_for_confirmed:
+            return VerificationStatus.CONFIRMED
+        elif cumulative_passes >= required_for_review:
+            return VerificationStatus.REVIEW
+        return VerificationStatus.DISCARDED
+
+    def compile_plan(self, methods: List[VerificationMethod]) -> VerificationPlan:
+        for method in methods:
+            self._validate_method(method)
+
+        # Embed every distinct reference text and cascade exemplar in a single call
+        texts_to_embed: List[str] = []
+        for method in methods:
+            if method.method_type == VerificationMethodType.EMBEDDING:
+                texts_to_embed.append(method.reference_text)
+            elif method.method_type == VerificationMethodType.CASCADE and method.cascade.uses_exemplars:
+                texts_to_embed.extend(method.cascade.positive_exemplars)
+                texts_to_embed.extend(method.cascade.negative_exemplars)
+        texts_to_embed = list(dict.fromkeys(texts_to_embed))
+        embedded = dict(zip(
+            texts_to_embed,
+            self.embeddings.get_embeddings(texts_to_embed) if texts_to_embed else []
+        ))
+
+        # Logistic weights are only meaningful over embeddings of their own dimension; without
+        # embeddings to compare against here, they are checked on the first texts scored
+        if embedded:
+            dimension = len(next(iter(embedded.values())))
+            for method in methods:
+                if method.method_type == VerificationMethodType.CASCADE and not method.cascade.uses_exemplars:
+                    self._check_cascade_dimension(method, dimension)
+
+        steps = []
+        for method in methods:
+            reference_embedding = None
+            compiled_pattern = None
+            positive_embeddings = None
+            negative_embeddings = None
+            if method.method_type == VerificationMethodType.EMBEDDING:
+                reference_embedding = tuple(embedded[method.reference_text])
+            elif method.method_type == VerificationMethodType.REGEX:
+                compiled_pattern = self._compiled_pattern(method)
+            elif method.method_type == VerificationMethodType.CASCADE and method.cascade.uses_exemplars:
+                positive_embeddings = tuple(tuple(embedded[t]) for t in method.cascade.positive_exemplars)
+                negative_embeddings = tuple(tuple(embedded[t]) for t in method.cascade.negative_exemplars)
+            steps.append(PlannedVerification(
+                method=method,
+                reference_embedding=reference_embedding,
+                compiled_pattern=compiled_pattern,
+                positive_embeddings=positive_embeddings,
+                negative_embeddings=negative_embeddings
+            ))
+
+        return VerificationPlan(steps=tuple(steps))
+
+    def _check_cascade_dimension(self, method: VerificationMethod, dimension: int) -> None:
+        if len(method.cascade.weights) != dimension:
+            raise InvalidVerificationMethod(
+                method.name,
+                f"Cascade has {len(method.cascade.weights)} weights but embeddings have dimension {dimension}"
+            )
+
+    def _plan_steps(
+        self,
+        methods: Union[List[VerificationMethod], VerificationPlan]
+    ) -> Tuple[PlannedVerification, ...]:
+        if isinstance(methods, VerificationPlan):
+            return methods.steps
+        return tuple(PlannedVerification(method=method) for method in methods)
+
+    def _validate_method(self, method: VerificationMethod) -> None:
+        if method.method_type == VerificationMethodType.EMBEDDING:
+            if not method.reference_text or not method.thresholds:
+                raise InvalidVerificationMethod(
+                    method.name, "Embedding verification requires reference text and thresholds"
+                )
+        elif method.method_type == VerificationMethodType.CONSENSUS:
+            if not method.required_matches:
+                raise InvalidVerificationMethod(
+                    method.name, "Consensus verification requires required_matches"
+                )
+        elif method.method_type == VerificationMethodType.REGEX:
+            pattern = getattr(method, 'pattern', None)
+            if not pattern:
+                raise InvalidVerificationMethod(method.name, "Regex verification requires a pattern")
+            self._compiled_pattern(method)
+        elif method.method_type == VerificationMethodType.CUSTOM:
+            if not callable(getattr(method, 'verification_function', None)):
+                raise InvalidVerificationMethod(
+                    method.name, "Custom verification requires a verification_function"
+                )
+        elif method.method_type == VerificationMethodType.CASCADE:
+            cascade = method.cascade
+            if not cascade or not method.required_matches:
+                raise InvalidVerificationMethod(
+                    method.name, "Cascade verification requires a cascade config and required_matches"
+                )
+            if cascade.uses_exemplars and not cascade.positive_exemplars:
+                raise InvalidVerificationMethod(
+                    method.name, "Cascade verification requires positive exemplars or logistic weights"
+                )
+            if not 0.0 <= cascade.reject_below <= cascade.accept_above <= 1.0:
+                raise InvalidVerificationMethod(
+                    method.name, "Cascade thresholds must satisfy 0 <= reject_below <= accept_above <= 1"
+                )
+        else:
+            raise InvalidVerificationMethod(
+                method.name, f"Unknown verification method type: {method.method_type}"
+            )
+
     def _apply_verification_method(
         self,
         method: VerificationMethod,
-        text: str
+        text: str,
+        step: Optional[PlannedVerification] = None,
+        deadline: Optional[float] = None
+    ) -> VerificationResult:
+        if not self._uses_cache(method):
+            return self._run_verification_method(method, text, step, deadline)
+
+        key = self._cache_key(method, text)
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+
+        result = self._run_verification_method(method, text, step, deadline)
+        # A result cut short by the deadline is not worth reusing
+        if not self._deadline_exceeded(deadline):
+            self._store_result(key, result)
+        return result
+
+    def _run_verification_method(
+        self,
+        method: VerificationMethod,
+        text: str,
+        step: Optional[PlannedVerification] = None,
+        deadline: Optional[float] = None
     ) -> VerificationResult:
         if method.method_type == VerificationMethodType.EMBEDDING:
-            return self._verify_embedding(method, text)
+            return self._verify_embedding(method, text, step)
         elif method.method_type == VerificationMethodType.CONSENSUS:
-            return self._verify_consensus(method, text)
+            return self._verify_consensus(method, text, deadline)
         elif method.method_type == VerificationMethodType.REGEX:
-            return self._verify_regex(method, text)
+            return self._verify_regex(method, text, step)
         elif method.method_type == VerificationMethodType.CUSTOM:
-            return self._verify_custom(method, text)
+            return self._verify_custom_batch(method, [text], deadline)[0]
+        elif method.method_type == VerificationMethodType.CASCADE:
+            return self._verify_cascade_batch(method, [text], step, deadline=deadline)[0]
         else:
             raise ValueError(f"Unknown verification method type: {method.method_type}")
 
-    def _verify_embedding(self, method: VerificationMethod, text: str) -> VerificationResult:
+    def _apply_verification_method_batch(
+        self,
+        step: PlannedVerification,
+        texts: List[str],
+        candidate_embeddings: Dict[str, List[float]],
+        deadline: Optional[float] = None
+    ) -> List[VerificationResult]:
+        if not self._uses_cache(step.method):
+            return self._run_verification_method_batch(step, texts, candidate_embeddings, deadline)
+
+        keys = [self._cache_key(step.method, text) for text in texts]
+        results: List[Optional[VerificationResult]] = [self._cached_result(key) for key in keys]
+
+        # Only cache misses reach the models
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            computed = self._run_verification_method_batch(
+                step, [texts[i] for i in missing], candidate_embeddings, deadline
+            )
+            exceeded = self._deadline_exceeded(deadline)
+            for i, result in zip(missing, computed):
+                if not exceeded:
+                    self._store_result(keys[i], result)
+                results[i] = result
+
+        return results
+
+    def _uses_cache(self, method: VerificationMethod) -> bool:
+        if self.cache is None:
+            return False
+        # A custom function that cannot be fingerprinted could share a key with another one
+        function = getattr(method, 'verification_function', None)
+        return function is None or function_fingerprint(function) is not None
+
+    def _cache_key(self, method: VerificationMethod, text: str) -> str:
+        text_digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"verification:{method.name}:{method_fingerprint(method)}:{text_digest}"
+
+    def _cached_result(self, key: str) -> Optional[VerificationResult]:
+        try:
+            cached = self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"Verification cache lookup failed: {str(e)}")
+            return None
+        if cached is None:
+            return None
+        return replace(cached, details={**(cached.details or {}), "cache_hit": True})
+
+    def _store_result(self, key: str, result: VerificationResult) -> None:
+        if not self._is_cacheable(result):
+            return
+        try:
+            self.cache.set(key, result, ttl=self.cache_ttl)
+        except Exception as e:
+            logger.warning(f"Verification cache store failed: {str(e)}")
+
+    def _is_cacheable(self, result: VerificationResult) -> bool:
+        if self.cache_sampled_consensus:
+            return True
+        method = result.method
+        if method.consensus_mode == ConsensusMode.LOGIT:
+            return True
+        if method.method_type == VerificationMethodType.CONSENSUS:
+            return False
+        if method.method_type == VerificationMethodType.CASCADE:
+            # Cascade results are only sampled when they were escalated
+            return not (result.details or {}).get("escalated", False)
+        return True
+
+    def _run_verification_method_batch(
+        self,
+        step: PlannedVerification,
+        texts: List[str],
+        candidate_embeddings: Dict[str, List[float]],
+        deadline: Optional[float] = None
+    ) -> List[VerificationResult]:
+        method = step.method
+        if method.method_type == VerificationMethodType.EMBEDDING:
+            return self._verify_embedding_batch(method, texts, step, candidate_embeddings)
+        elif method.method_type == VerificationMethodType.CONSENSUS:
+            return self._verify_consensus_batch(method, texts, deadline)
+        elif method.method_type == VerificationMethodType.CASCADE:
+            return self._verify_cascade_batch(method, texts, step, candidate_embeddings, deadline)
+        elif method.method_type == VerificationMethodType.CUSTOM:
+            return self._verify_custom_batch(method, texts, deadline)
+        # Regex checks are cheap per text
+        return [self._run_verification_method(method, text, step) for text in texts]
+
+    def _verify_embedding(
+        self,
+        method: VerificationMethod,
+        text: str,
+        step: Optional[PlannedVerification] = None
+    ) -> VerificationResult:
+        if not method.reference_text or not method.thresholds:
+            raise ValueError("Embedding verification requires reference text and thresholds")
+
+        if step is not None and step.reference_embedding is not None:
+            # Compiled plans already hold the reference embedding; only the candidate is embedded
+            similarity = SimilarityScore(
+                value=cosine_similarity(step.reference_embedding, self.embeddings.get_embedding(text)),
+                method="precomputed_reference",
+                reference_text=method.reference_text,
+                compared_text=text
+            )
+        else:
+            similarity = self.embeddings.get_similarity(method.reference_text, text)
+
+        return self._embedding_result(method, similarity.value)
+
+    def _verify_embedding_batch(
+        self,
+        method: VerificationMethod,
+        texts: List[str],
+        step: PlannedVerification,
+        candidate_embeddings: Dict[str, List[float]]
+    ) -> List[VerificationResult]:
         if not method.reference_text or not method.thresholds:
             raise ValueError("Embedding verification requires reference text and thresholds")
 
-        similarity = self.embeddings.get_similarity(method.reference_text, text)
-        passed = method.thresholds.is_within_bounds(similarity.value)
+        if step.reference_embedding is not None:
+            # Candidate embeddings are shared by every embedding method of the batch
+            missing = [text for text in dict.fromkeys(texts) if text not in candidate_embeddings]
+            if missing:
+                candidate_embeddings.update(zip(missing, self.embeddings.get_embeddings(missing)))
+            values = [
+                cosine_similarity(step.reference_embedding, candidate_embeddings[text])
+                for text in texts
+            ]
+        else:
+            values = [
+                similarity.value
+                for similarity in self.embeddings.batch_similarities(method.reference_text, texts)
+            ]
+
+        return [self._embedding_result(method, value) for value in values]
+
+    def _embedding_result(self, method: VerificationMethod, similarity: float) -> VerificationResult:
+        passed = method.thresholds.is_within_bounds(similarity)
 
         return VerificationResult(
             method=method,
             passed=passed,
-            score=similarity.value,
+            score=similarity,
             details={
-                "similarity_score": similarity.value,
+                "similarity_score": similarity,
                 "reference_text": method.reference_text,
                 "thresholds": {
                     "lower": method.thresholds.lower_bound,
@@ -93,28 +872,78 @@ class VerifierService:
             }
         )
 
-    def _verify_consensus(self, method: VerificationMethod, text: str) -> VerificationResult:
+    def _verify_consensus(
+        self,
+        method: VerificationMethod,
+        text: str,
+        deadline: Optional[float] = None
+    ) -> VerificationResult:
         if not method.required_matches:
             raise ValueError("Consensus verification requires required_matches")
 
+        system_prompt, user_prompt = self._consensus_prompts(text)
+
+        if method.consensus_mode == ConsensusMode.LOGIT:
+            # A single prefill pass gives the probability of answering yes
+            probabilities = self.llm.score_next_token(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                candidates=["yes", "no"]
+            )
+            return self._logit_consensus_result(method, probabilities)
+
+        if method.consensus_mode == ConsensusMode.SEQUENTIAL:
+            return self._sequential_consensus(method, [(system_prompt, user_prompt)], deadline)[0]
+
         # Generate multiple verifications using LLM
-        system_prompt = f"Verify the following text:\n{text}"
-        user_prompt = "Is this text valid? Respond with 'yes' or 'no'."
-        
         responses = self.llm.generate(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
-            num_sequences=5,  # Generate 5 independent verifications
-            max_tokens=10  # Short responses expected
+            num_sequences=self.CONSENSUS_VOTES,  # Independent verifications
+            max_tokens=10,  # Short responses expected
+            max_time=self._remaining_time(deadline)
         )
 
-        positive_responses = sum(1 for r in responses if r.content.strip().lower() == 'yes')
+        return self._sampling_consensus_result(method, responses)
+
+    def _verify_consensus_batch(
+        self,
+        method: VerificationMethod,
+        texts: List[str],
+        deadline: Optional[float] = None
+    ) -> List[VerificationResult]:
+        if not method.required_matches:
+            raise ValueError("Consensus verification requires required_matches")
+
+        prompts = [self._consensus_prompts(text) for text in texts]
+
+        if method.consensus_mode == ConsensusMode.LOGIT:
+            probabilities = self.llm.score_next_token_batch(prompts, candidates=["yes", "no"])
+            return [self._logit_consensus_result(method, p) for p in probabilities]
+
+        if method.consensus_mode == ConsensusMode.SEQUENTIAL:
+            return self._sequential_consensus(method, prompts, deadline)
+
+        responses = self.llm.generate_batch(
+            prompts,
+            num_sequences=self.CONSENSUS_VOTES,
+            max_tokens=10,
+            max_time=self._remaining_time(deadline)
+        )
+        return [self._sampling_consensus_result(method, r) for r in responses]
+
+    def _sampling_consensus_result(
+        self,
+        method: VerificationMethod,
+        responses: List[GeneratedResult]
+    ) -> VerificationResult:
+        positive_responses = sum(1 for r in responses if self._is_positive_vote(r.content))
         passed = positive_responses >= method.required_matches
 
         return VerificationResult(
             method=method,
             passed=passed,
-            score=positive_responses / len(responses),
+            score=positive_responses / len(responses) if responses else 0.0,
             details={
                 "total_responses": len(responses),
                 "positive_responses": positive_responses,
@@ -122,13 +951,290 @@ class VerifierService:
             }
         )
 
-    def _verify_regex(self, method: VerificationMethod, text: str) -> VerificationResult:
-        import re
-        if not hasattr(method, 'pattern'):
+    def _sequential_consensus(
+        self,
+        method: VerificationMethod,
+        prompts: List[Tuple[str, str]],
+        deadline: Optional[float] = None
+    ) -> List[VerificationResult]:
+        positive_responses = [0] * len(prompts)
+        samples_drawn = [0] * len(prompts)
+        sampling_rounds = [0] * len(prompts)
+        exhausted = [False] * len(prompts)
+
+        while True:
+            # Group undecided prompts by how many positive votes they still miss.
+            # A prompt is settled once it has enough votes, or too few draws remain
+            # to ever reach required_matches
+            pending: Dict[int, List[int]] = {}
+            for i in range(len(prompts)):
+                needed = method.required_matches - positive_responses[i]
+                remaining = self.CONSENSUS_VOTES - samples_drawn[i]
+                if not exhausted[i] and 0 < needed <= remaining:
+                    pending.setdefault(needed, []).append(i)
+            if not pending or self._deadline_exceeded(deadline):
+                break
+
+            # Drawing exactly the missing votes means an all-yes round decides the check
+            for needed, indices in pending.items():
+                if len(indices) == 1:
+                    system_prompt, user_prompt = prompts[indices[0]]
+                    responses = [self.llm.generate(
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        num_sequences=needed,
+                        max_tokens=10,
+                        max_time=self._remaining_time(deadline)
+                    )]
+                else:
+                    responses = self.llm.generate_batch(
+                        [prompts[i] for i in indices],
+                        num_sequences=needed,
+                        max_tokens=10,
+                        max_time=self._remaining_time(deadline)
+                    )
+
+                for i, votes in zip(indices, responses):
+                    if not votes:
+                        exhausted[i] = True
+                        continue
+                    samples_drawn[i] += len(votes)
+                    positive_responses[i] += sum(1 for r in votes if self._is_positive_vote(r.content))
+                    sampling_rounds[i] += 1
+
+        return [
+            VerificationResult(
+                method=method,
+                passed=positive_responses[i] >= method.required_matches,
+                score=positive_responses[i] / samples_drawn[i] if samples_drawn[i] else 0.0,
+                details={
+                    "consensus_mode": ConsensusMode.SEQUENTIAL.value,
+                    "total_responses": samples_drawn[i],
+                    "positive_responses": positive_responses[i],
+                    "required_matches": method.required_matches,
+                    "samples_drawn": samples_drawn[i],
+                    "max_samples": self.CONSENSUS_VOTES,
+                    "sampling_rounds": sampling_rounds[i]
+                }
+            )
+            for i in range(len(prompts))
+        ]
+
+    def _logit_consensus_result(
+        self,
+        method: VerificationMethod,
+        probabilities: Dict[str, float]
+    ) -> VerificationResult:
+        # The probability of answering yes stands in for the expected share of
+        # positive votes without sampling any of them
+        yes_probability = probabilities.get("yes", 0.0)
+        no_probability = probabilities.get("no", 0.0)
+        total = yes_probability + no_probability
+        score = yes_probability / total if total > 0 else 0.0
+        expected_positive_votes = score * self.CONSENSUS_VOTES
+        passed = expected_positive_votes >= method.required_matches
+
+        return VerificationResult(
+            method=method,
+            passed=passed,
+            score=score,
+            details={
+                "consensus_mode": ConsensusMode.LOGIT.value,
+                "yes_probability": yes_probability,
+                "no_probability": no_probability,
+                "simulated_votes": self.CONSENSUS_VOTES,
+                "expected_positive_votes": expected_positive_votes,
+                "required_matches": method.required_matches
+            }
+        )
+
+    def _verify_cascade_batch(
+        self,
+        method: VerificationMethod,
+        texts: List[str],
+        step: Optional[PlannedVerification] = None,
+        candidate_embeddings: Optional[Dict[str, List[float]]] = None,
+        deadline: Optional[float] = None
+    ) -> List[VerificationResult]:
+        cascade = method.cascade
+        if not cascade or not method.required_matches:
+            raise ValueError("Cascade verification requires a cascade config and required_matches")
+
+        started = time.perf_counter()
+        scores = self._cascade_scores(method, texts, step, candidate_embeddings)
+        first_stage_time = (time.perf_counter() - started) / len(texts)
+
+        # Only texts the cheap stage is unsure about pay for LLM consensus
+        uncertain = [
+            i for i, score in enumerate(scores)
+            if cascade.reject_below < score < cascade.accept_above
+        ]
+        consensus_results: Dict[int, VerificationResult] = {}
+        consensus_time = 0.0
+        if uncertain:
+            started = time.perf_counter()
+            if len(uncertain) == 1:
+                escalated = [self._verify_consensus(method, texts[uncertain[0]], deadline)]
+            else:
+                escalated = self._verify_consensus_batch(method, [texts[i] for i in uncertain], deadline)
+            consensus_time = (time.perf_counter() - started) / len(uncertain)
+            consensus_results = dict(zip(uncertain, escalated))
+
+        key = method_statistics_key(method)
+        with self._statistics_lock:
+            counters = self._cascade_counters.setdefault(key, _CascadeCounters())
+            counters.evaluations += len(texts)
+            counters.escalations += len(uncertain)
+            counters.consensus_time += consensus_time * len(uncertain)
+            # Confident texts save what a consensus check would have cost them
+            expected_consensus_time = (
+                counters.consensus_time / counters.escalations
+                if counters.escalations else self.LATENCY_PRIORS[VerificationMethodType.CONSENSUS]
+            )
+            time_saved = max(expected_consensus_time - first_stage_time, 0.0)
+            counters.time_saved += time_saved * (len(texts) - len(uncertain))
+            escalation_rate = counters.escalations / counters.evaluations
+            total_time_saved = counters.time_saved
+
+        results = []
+        for i, score in enumerate(scores):
+            details = {
+                "cascade_score": score,
+                "first_stage": "exemplars" if cascade.uses_exemplars else "logistic",
+                "accept_above": cascade.accept_above,
+                "reject_below": cascade.reject_below,
+                "escalated": i in consensus_results,
+                "first_stage_time": first_stage_time,
+                "escalation_rate": escalation_rate,
+                "total_estimated_time_saved": total_time_saved
+            }
+            consensus = consensus_results.get(i)
+            if consensus is None:
+                details["estimated_time_saved"] = time_saved
+                results.append(VerificationResult(
+                    method=method,
+                    passed=score >= cascade.accept_above,
+                    score=score,
+                    details=details
+                ))
+            else:
+                details["consensus_time"] = consensus_time
+                details["consensus"] = consensus.details
+                results.append(VerificationResult(
+                    method=method,
+                    passed=consensus.passed,
+                    score=consensus.score,
+                    details=details
+                ))
+
+        return results
+
+    def _cascade_scores(
+        self,
+        method: VerificationMethod,
+        texts: List[str],
+        step: Optional[PlannedVerification] = None,
+        candidate_embeddings: Optional[Dict[str, List[float]]] = None
+    ) -> List[float]:
+        cascade = method.cascade
+        candidate_embeddings = candidate_embeddings if candidate_embeddings is not None else {}
+        missing = [text for text in dict.fromkeys(texts) if text not in candidate_embeddings]
+        if missing:
+            candidate_embeddings.update(zip(missing, self.embeddings.get_embeddings(missing)))
+        embeddings = [candidate_embeddings[text] for text in texts]
+
+        if not cascade.uses_exemplars:
+            if embeddings:
+                self._check_cascade_dimension(method, len(embeddings[0]))
+            return [_sigmoid(_dot(cascade.weights, embedding) + cascade.bias) for embedding in embeddings]
+
+        if step is not None and step.positive_embeddings is not None:
+            positives, negatives = step.positive_embeddings, step.negative_embeddings
+        else:
+            exemplars = self.embeddings.get_embeddings(
+                list(cascade.positive_exemplars) + list(cascade.negative_exemplars)
+            )
+            positives = exemplars[:len(cascade.positive_exemplars)]
+            negatives = exemplars[len(cascade.positive_exemplars):]
+
+        # Map the margin between the closest valid and closest invalid exemplar to [0, 1]
+        scores = []
+        for embedding in embeddings:
+            positive = max(cosine_similarity(embedding, exemplar) for exemplar in positives)
+            if negatives:
+                negative = max(cosine_similarity(embedding, exemplar) for exemplar in negatives)
+                score = (1.0 + positive - negative) / 2.0
+            else:
+                score = (1.0 + positive) / 2.0
+            scores.append(min(max(score, 0.0), 1.0))
+        return scores
+
+    def fit_cascade(
+        self,
+        method: VerificationMethod,
+        texts: List[str],
+        labels: List[bool],
+        epochs: int = 200,
+        learning_rate: float = 0.5,
+        l2: float = 1e-3
+    ) -> VerificationMethod:
+        if method.method_type != VerificationMethodType.CASCADE or not method.cascade:
+            raise InvalidVerificationMethod(method.name, "Only cascade methods can be fitted")
+        if not texts or len(texts) != len(labels):
+            raise ValueError("fit_cascade requires one label per text")
+
+        # Plain batch gradient descent on the logistic loss over the text embeddings,
+        # e.g. with labels taken from stored benchmark results
+        features = np.asarray(self.embeddings.get_embeddings(texts), dtype=np.float64)
+        targets = np.asarray(labels, dtype=np.float64)
+        weights = np.zeros(features.shape[1])
+        bias = 0.0
+
+        for _ in range(epochs):
+            # Halved tanh is the logistic function without overflow for large margins
+            predictions = 0.5 * (1.0 + np.tanh(0.5 * (features @ weights + bias)))
+            errors = (predictions - targets) / len(texts)
+            weights -= learning_rate * (features.T @ errors + l2 * weights)
+            bias -= learning_rate * float(errors.sum())
+
+        return replace(method, cascade=replace(
+            method.cascade, weights=tuple(weights.tolist()), bias=bias
+        ))
+
+    def _remaining_time(self, deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        return max(deadline - time.monotonic(), 0.0)
+
+    def _deadline_exceeded(self, deadline: Optional[float]) -> bool:
+        return deadline is not None and time.monotonic() >= deadline
+
+    def _is_positive_vote(self, content: str) -> bool:
+        return content.strip().lower() == 'yes'
+
+    def _consensus_prompts(self, text: str) -> Tuple[str, str]:
+        system_prompt = f"Verify the following text:\n{text}"
+        user_prompt = "Is this text valid? Respond with 'yes' or 'no'."
+        return system_prompt, user_prompt
+
+    def _verify_regex(
+        self,
+        method: VerificationMethod,
+        text: str,
+        step: Optional[PlannedVerification] = None
+    ) -> VerificationResult:
+        if not method.pattern:
             raise ValueError("Regex verification requires a pattern")
 
-        pattern = getattr(method, 'pattern')
-        matches = re.findall(pattern, text)
+        pattern = method.pattern
+        if step is not None and step.compiled_pattern is not None:
+            compiled = step.compiled_pattern
+        else:
+            compiled = self._compiled_pattern(method)
+        with regex_budget(self.regex_time_budget, lambda elapsed: VerificationExecutionError(
+            method.name, f"Regex matching stopped after {elapsed:.3f}s, over its {self.regex_time_budget:g}s budget"
+        )):
+            matches = compiled.findall(text)
         passed = len(matches) > 0
 
         return VerificationResult(
@@ -141,13 +1247,55 @@ class VerifierService:
             }
         )
 
-    def _verify_custom(self, method: VerificationMethod, text: str) -> VerificationResult:
-        if not hasattr(method, 'verification_function'):
+    def _compiled_pattern(self, method: VerificationMethod) -> re.Pattern:
+        # Planned or not, every regex method is compiled and checked here before it runs
+        try:
+            compiled = self.pattern_cache.compile(method.pattern)
+        except re.error as e:
+            raise InvalidVerificationMethod(method.name, f"Invalid regex pattern: {str(e)}")
+        problem = find_catastrophic_construct(method.pattern)
+        if problem:
+            raise InvalidVerificationMethod(
+                method.name, f"Regex pattern may backtrack catastrophically: {problem}"
+            )
+        return compiled
+
+    def _verify_custom_batch(
+        self,
+        method: VerificationMethod,
+        texts: List[str],
+        deadline: Optional[float] = None
+    ) -> List[VerificationResult]:
+        if not callable(method.verification_function):
             raise ValueError("Custom verification requires a verification_function")
 
-        verification_func = getattr(method, 'verification_function')
-        result = verification_func(text)
-        
+        verification_func = method.verification_function
+        executor = self.function_executor
+        if executor is None or not executor.supports(verification_func):
+            return [self._custom_result(method, verification_func(text), executed_in_pool=False) for text in texts]
+
+        try:
+            try:
+                outputs = executor.map(verification_func, texts, max_total_time=self._remaining_time(deadline))
+            except BrokenExecutor:
+                # Another call timing out restarts the shared workers; the fresh ones get one more try
+                logger.warning(f"Process pool restarted while running {method.name}, retrying")
+                outputs = executor.map(verification_func, texts, max_total_time=self._remaining_time(deadline))
+        except (TimeoutError, BrokenExecutor) as e:
+            if self._deadline_exceeded(deadline):
+                # Out of verification time, like a model call cut short: the texts time out
+                skipped = PlannedVerification(method=method)
+                return [self._skipped_result(skipped, VerificationStatus.TIMEOUT) for _ in texts]
+            raise VerificationExecutionError(method.name, str(e) or "Process pool workers stopped")
+
+        return [self._custom_result(method, output, executed_in_pool=True) for output in outputs]
+
+    def _custom_result(
+        self,
+        method: VerificationMethod,
+        result,
+        executed_in_pool: bool
+    ) -> VerificationResult:
         if isinstance(result, tuple):
             passed, score = result
         else:
@@ -159,6 +1307,16 @@ class VerifierService:
             passed=passed,
             score=score,
             details={
-                "custom_verification": "Applied custom verification function"
+                "custom_verification": "Applied custom verification function",
+                "executed_in_process_pool": executed_in_pool
             }
-        )
\ No newline at end of file
+        )
+
+def _dot(vector1, vector2) -> float:
+    return sum(a * b for a, b in zip(vector1, vector2))
+
+def _sigmoid(value: float) -> float:
+    if value >= 0:
+        return 1.0 / (1.0 + math.exp(-value))
+    exp_value = math.exp(value)
+    return exp_value / (1.0 + exp_value)
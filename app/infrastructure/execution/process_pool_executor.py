@@ -0,0 +1,158 @@
+# infrastructure/execution/process_pool_executor.py
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+import weakref
+from ...domain.ports.function_executor_port import FunctionExecutorPort
+
+logger = logging.getLogger(__name__)
+
+def _apply_chunk(function: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    return [function(item) for item in items]
+
+def _warm_up() -> int:
+    return os.getpid()
+
+class ProcessPoolFunctionExecutor(FunctionExecutorPort):
+    """Runs functions in a warm pool of worker processes, several items per task."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 16,
+        calls_per_worker: Optional[int] = 1000,
+        default_timeout: Optional[float] = None,
+        start_method: Optional[str] = None
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.calls_per_worker = calls_per_worker
+        self.default_timeout = default_timeout
+        self._context = multiprocessing.get_context(start_method) if start_method else None
+
+        self._lock = threading.Lock()
+        # Dropped with the functions, so a new function never inherits a stale answer
+        self._supported: "weakref.WeakKeyDictionary[Callable, bool]" = weakref.WeakKeyDictionary()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._calls_since_start = 0
+        self._start_pool()
+
+        logger.info(
+            f"Initialized ProcessPoolFunctionExecutor (max_workers={self.max_workers}, "
+            f"chunk_size={chunk_size}, calls_per_worker={calls_per_worker})"
+        )
+
+    def map(
+        self,
+        function: Callable[[Any], Any],
+        items: List[Any],
+        timeout: Optional[float] = None,
+        max_total_time: Optional[float] = None
+    ) -> List[Any]:
+        if not items:
+            return []
+        timeout = timeout if timeout is not None else self.default_timeout
+
+        # Spread items over the workers, but never more than chunk_size per task
+        chunk_size = min(self.chunk_size, max(1, -(-len(items) // self.max_workers)))
+        chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+        with self._lock:
+            pool = self._pool
+            if pool is None:
+                raise RuntimeError("ProcessPoolFunctionExecutor is closed")
+            self._calls_since_start += len(items)
+        futures = [pool.submit(_apply_chunk, function, chunk) for chunk in chunks]
+
+        # Chunks run in waves of max_workers, each wave bounded by its calls' timeouts;
+        # a single call may overrun its timeout as long as the whole map does not
+        call_deadline = None
+        if timeout is not None:
+            call_deadline = time.monotonic() + timeout * chunk_size * -(-len(chunks) // self.max_workers)
+        total_deadline = time.monotonic() + max_total_time if max_total_time is not None else None
+        deadline = min(
+            (limit for limit in (call_deadline, total_deadline) if limit is not None), default=None
+        )
+        results: List[Any] = []
+        try:
+            for future in futures:
+                remaining = max(deadline - time.monotonic(), 0.0) if deadline is not None else None
+                results.extend(future.result(timeout=remaining))
+        except FutureTimeoutError:
+            for future in futures:
+                future.cancel()
+            name = getattr(function, '__name__', function)
+            if deadline == call_deadline:
+                # A hung function keeps its worker busy forever; replace the whole pool
+                self._restart_pool(pool)
+                raise TimeoutError(f"Function {name} ran out of time")
+            # The caller's time is up, but the calls are not hung: chunks already running
+            # finish in the background and their results are dropped
+            raise TimeoutError(f"Map of {name} exceeded its {max_total_time:g}s limit")
+
+        self._recycle_if_due(pool)
+        return results
+
+    def supports(self, function: Callable[[Any], Any]) -> bool:
+        try:
+            return self._supported[function]
+        except (KeyError, TypeError):
+            pass
+
+        try:
+            pickle.dumps(function)
+            supported = True
+        except Exception:
+            supported = False
+        try:
+            self._supported[function] = supported
+        except TypeError:
+            # Not weakly referenceable; checked again on every call
+            pass
+        return supported
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+    def _start_pool(self) -> None:
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._context)
+        self._calls_since_start = 0
+        # Start every worker now so the first verification does not pay for it
+        for future in [self._pool.submit(_warm_up) for _ in range(self.max_workers)]:
+            future.result()
+
+    def _recycle_if_due(self, pool: ProcessPoolExecutor) -> None:
+        # Workers are replaced together once they have served calls_per_worker calls
+        # on average, which bounds memory leaked by user functions. The old pool
+        # finishes the tasks it already holds in the background
+        with self._lock:
+            if (
+                not self.calls_per_worker
+                or self._pool is not pool
+                or self._calls_since_start < self.calls_per_worker * self.max_workers
+            ):
+                return
+            logger.info("Recycling process pool workers")
+            self._start_pool()
+        pool.shutdown(wait=False)
+
+    def _restart_pool(self, failed_pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is not failed_pool:
+                return
+            logger.warning("Restarting process pool after a timed out call")
+            for process in list((getattr(failed_pool, "_processes", None) or {}).values()):
+                process.terminate()
+            failed_pool.shutdown(wait=False, cancel_futures=True)
+            self._start_pool()
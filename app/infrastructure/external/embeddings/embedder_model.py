@@ -5,8 +5,10 @@ import torch
 import torch.nn.functional as F
 from transformers import AutoModel, AutoTokenizer
 import logging
+import numpy as np
 from ....domain.ports.embeddings_port import EmbeddingsPort
 from ....domain.model.value_objects.similarity_score import SimilarityScore
+from .embedding_store import EmbeddingStore, EmbeddingStoreStats
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +17,17 @@ class EmbedderModel(EmbeddingsPort):
         self,
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
         device: Optional[str] = None,
-        cache_dir: Optional[str] = None
+        cache_dir: Optional[str] = None,
+        max_length: int = 512,
+        batch_size: int = 32,
+        embedding_store: Optional[EmbeddingStore] = None
     ):
         self.model_name = model_name
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
         self.cache_dir = cache_dir
+        self.max_length = max_length
+        self.batch_size = batch_size
+        self.embedding_store = embedding_store
         
         logger.info(f"Initializing EmbedderModel with {model_name} on {self.device}")
         try:
@@ -32,11 +40,10 @@ class EmbedderModel(EmbeddingsPort):
 
     def get_similarity(self, text1: str, text2: str) -> SimilarityScore:
         try:
-            emb1 = self._get_embedding(text1)
-            emb2 = self._get_embedding(text2)
+            embeddings = self._get_embeddings([text1, text2])
             
             # Calculate cosine similarity
-            similarity = F.cosine_similarity(emb1, emb2).item()
+            similarity = F.cosine_similarity(embeddings[0:1], embeddings[1:2]).item()
             
             return SimilarityScore(
                 value=similarity,
@@ -50,63 +57,103 @@ class EmbedderModel(EmbeddingsPort):
 
     def get_embedding(self, text: str) -> List[float]:
         try:
-            embedding = self._get_embedding(text)
+            embedding = self._get_embeddings([text])
             return embedding.squeeze().tolist()
         except Exception as e:
             logger.error(f"Error getting embedding: {str(e)}")
             raise
 
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+
+        try:
+            return self._get_embeddings(texts).tolist()
+        except Exception as e:
+            logger.error(f"Error getting embeddings: {str(e)}")
+            raise
+
     def batch_similarities(
         self,
         reference_text: str,
         comparison_texts: List[str]
     ) -> List[SimilarityScore]:
+        if not comparison_texts:
+            return []
+
         try:
-            ref_embedding = self._get_embedding(reference_text)
-            similarities = []
-            
-            # Process in batches
-            batch_size = 32
-            for i in range(0, len(comparison_texts), batch_size):
-                batch = comparison_texts[i:i + batch_size]
-                batch_embeddings = torch.cat([
-                    self._get_embedding(text) for text in batch
-                ])
-                
-                # Calculate similarities for the batch
-                batch_similarities = F.cosine_similarity(
-                    batch_embeddings,
-                    ref_embedding.expand(len(batch), -1)
+            # The reference is embedded alongside the comparison texts
+            embeddings = self._get_embeddings([reference_text] + comparison_texts)
+            ref_embedding = embeddings[0:1]
+            comparison_embeddings = embeddings[1:]
+
+            similarities = F.cosine_similarity(
+                comparison_embeddings,
+                ref_embedding.expand(len(comparison_texts), -1)
+            ).tolist()
+
+            return [
+                SimilarityScore(
+                    value=similarity,
+                    method=self.model_name,
+                    reference_text=reference_text,
+                    compared_text=text
                 )
-                
-                # Create SimilarityScore objects
-                for text, sim in zip(batch, batch_similarities):
-                    similarities.append(SimilarityScore(
-                        value=sim.item(),
-                        method=self.model_name,
-                        reference_text=reference_text,
-                        compared_text=text
-                    ))
-            
-            return similarities
+                for text, similarity in zip(comparison_texts, similarities)
+            ]
         except Exception as e:
             logger.error(f"Error calculating batch similarities: {str(e)}")
             raise
 
-    def _get_embedding(self, text: str) -> torch.Tensor:
-        # Tokenize and prepare input
-        tokens = self.tokenizer(
-            text,
-            max_length=512,
-            padding=True,
-            truncation=True,
-            return_tensors='pt'
-        ).to(self.device)
-        
-        # Get embeddings
-        with torch.no_grad():
-            output = self.model(**tokens)
-        
-        # Use CLS token embedding and normalize
-        embedding = F.normalize(output.last_hidden_state[:, 0], p=2, dim=1)
-        return embedding
\ No newline at end of file
+    def embedding_store_stats(self) -> Optional[EmbeddingStoreStats]:
+        if self.embedding_store is None:
+            return None
+        return self.embedding_store.stats()
+
+    def _get_embeddings(self, texts: List[str]) -> torch.Tensor:
+        if self.embedding_store is None:
+            return self._encode(texts)
+
+        cached = self.embedding_store.get_many(texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+
+        # Only texts the store has never seen go through the model
+        if missing:
+            computed = self._encode(missing).float().cpu().numpy()
+            self.embedding_store.put_many(missing, computed)
+            fresh = dict(zip(missing, computed))
+            cached = [fresh[text] if vector is None else vector for text, vector in zip(texts, cached)]
+
+        return torch.from_numpy(np.stack(cached)).to(self.device)
+
+    def _encode(self, texts: List[str]) -> torch.Tensor:
+        # Tokenize everything once, without padding, to learn the real lengths
+        encoded = self.tokenizer(
+            texts,
+            max_length=self.max_length,
+            truncation=True
+        )
+
+        # Bucket by length so each batch only pads to texts of similar size
+        order = sorted(range(len(texts)), key=lambda i: len(encoded["input_ids"][i]))
+        embeddings: Optional[torch.Tensor] = None
+
+        for start in range(0, len(order), self.batch_size):
+            batch_indices = order[start:start + self.batch_size]
+            tokens = self.tokenizer.pad(
+                {key: [encoded[key][i] for i in batch_indices] for key in encoded.keys()},
+                return_tensors='pt'
+            ).to(self.device)
+            
+            # One forward pass per batch
+            with torch.no_grad():
+                output = self.model(**tokens)
+            
+            # Use CLS token embedding and normalize
+            batch_embeddings = F.normalize(output.last_hidden_state[:, 0], p=2, dim=1)
+
+            if embeddings is None:
+                embeddings = batch_embeddings.new_empty((len(texts), batch_embeddings.shape[1]))
+            embeddings[torch.tensor(batch_indices, device=batch_embeddings.device)] = batch_embeddings
+
+        return embeddings
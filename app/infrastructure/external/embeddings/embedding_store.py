@@ -0,0 +1,254 @@
+# infrastructure/external/embeddings/embedding_store.py
+from typing import List, Optional, Sequence
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+import atexit
+import hashlib
+import logging
+import re
+import threading
+import weakref
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class EmbeddingStoreStats:
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    memory_entries: int
+    disk_entries: int
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+class EmbeddingStore:
+    """Two-level embedding cache: an in-memory LRU over memory-mapped arrays on disk.
+
+    Vectors, keys and last-access ticks live in three .npy files per model, so a new
+    process can serve hits straight from the page cache. Only one process should
+    write to a given store directory at a time. Both tiers hold vectors at the
+    store's dtype, so a text gets the same vector whichever tier serves it. Writes
+    are flushed every flush_every vectors, on close and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        store_dir: str,
+        model_name: str,
+        max_entries: int = 100_000,
+        memory_entries: int = 10_000,
+        dtype: str = "float16",
+        flush_every: int = 1024
+    ):
+        if dtype not in ("float16", "float32"):
+            raise ValueError(f"Unsupported embedding store dtype: {dtype}")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.dtype = np.dtype(dtype)
+        self.flush_every = flush_every
+
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+        prefix = f"{slug}.{self.dtype.name}"
+        self._vectors_path = self.store_dir / f"{prefix}.vectors.npy"
+        self._keys_path = self.store_dir / f"{prefix}.keys.npy"
+        self._ticks_path = self.store_dir / f"{prefix}.ticks.npy"
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._rows: "OrderedDict[bytes, int]" = OrderedDict()
+        self._free_rows: List[int] = []
+        self._vectors: Optional[np.ndarray] = None
+        self._keys: Optional[np.ndarray] = None
+        self._ticks: Optional[np.ndarray] = None
+        self._tick = 0
+        self._unflushed = 0
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._open()
+        # Held weakly, so the hook does not keep an abandoned store alive
+        self._exit_hook = partial(_flush_store, weakref.ref(self))
+        atexit.register(self._exit_hook)
+        logger.info(f"Initialized embedding store at {store_dir} with {len(self._rows)} entries")
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        results: List[Optional[np.ndarray]] = []
+        with self._lock:
+            for text in texts:
+                key = self._key(text)
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    self._memory_hits += 1
+                else:
+                    row = self._rows.get(key)
+                    if row is None:
+                        self._misses += 1
+                    else:
+                        vector = np.array(self._vectors[row], dtype=np.float32)
+                        self._touch(key, row)
+                        self._remember(key, vector)
+                        self._disk_hits += 1
+                results.append(vector)
+        return results
+
+    def put_many(self, texts: Sequence[str], vectors: np.ndarray) -> None:
+        # Rounded to the disk precision, so memory hits match what a disk hit would return
+        vectors = np.asarray(vectors, dtype=self.dtype).astype(np.float32)
+        with self._lock:
+            if self._vectors is None:
+                self._create(vectors.shape[1])
+            elif vectors.shape[1] != self._vectors.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match store "
+                    f"dimension {self._vectors.shape[1]}"
+                )
+
+            for text, vector in zip(texts, vectors):
+                key = self._key(text)
+                row = self._rows.get(key)
+                if row is None:
+                    row = self._allocate_row()
+                # The key is written after the vector so a row is never labelled
+                # before its data is in place
+                self._vectors[row] = vector
+                self._keys[row] = key
+                self._touch(key, row)
+                self._remember(key, vector)
+
+            self._unflushed += len(texts)
+            if self.flush_every and self._unflushed >= self.flush_every:
+                self._flush()
+
+    def stats(self) -> EmbeddingStoreStats:
+        with self._lock:
+            return EmbeddingStoreStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                memory_entries=len(self._memory),
+                disk_entries=len(self._rows)
+            )
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        atexit.unregister(self._exit_hook)
+        self.flush()
+        with self._lock:
+            self._vectors = self._keys = self._ticks = None
+            self._memory.clear()
+            self._rows.clear()
+            self._free_rows = []
+
+    def _flush(self) -> None:
+        for array in (self._vectors, self._keys, self._ticks):
+            if array is not None:
+                array.flush()
+        self._unflushed = 0
+
+    def _key(self, text: str) -> bytes:
+        digest = hashlib.blake2b(f"{self.model_name}\0{text}".encode("utf-8"), digest_size=16)
+        return digest.hexdigest().encode("ascii")
+
+    def _touch(self, key: bytes, row: int) -> None:
+        self._tick += 1
+        self._ticks[row] = self._tick
+        self._rows[key] = row
+        self._rows.move_to_end(key)
+
+    def _remember(self, key: bytes, vector: np.ndarray) -> None:
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _allocate_row(self) -> int:
+        if self._free_rows:
+            return self._free_rows.pop()
+
+        # Budget reached: reuse the least recently used row
+        key, row = self._rows.popitem(last=False)
+        self._keys[row] = b""
+        self._memory.pop(key, None)
+        self._evictions += 1
+        return row
+
+    def _open(self) -> None:
+        if not self._vectors_path.exists():
+            return
+
+        vectors = np.load(self._vectors_path, mmap_mode="r+")
+        keys = np.load(self._keys_path, mmap_mode="r+")
+        ticks = np.load(self._ticks_path, mmap_mode="r+")
+
+        # Rebuild the LRU order from the persisted access ticks
+        occupied = [row for row in range(len(keys)) if keys[row]]
+        occupied.sort(key=lambda row: ticks[row])
+
+        if len(keys) != self.max_entries:
+            logger.info(f"Resizing embedding store from {len(keys)} to {self.max_entries} entries")
+            kept = occupied[-self.max_entries:]
+            saved = (np.array(vectors[kept]), np.array(keys[kept]), np.array(ticks[kept]))
+            del vectors, keys, ticks
+            self._create(saved[0].shape[1])
+            for row, (vector, key, tick) in enumerate(zip(*saved)):
+                self._vectors[row] = vector
+                self._keys[row] = key
+                self._ticks[row] = tick
+                self._rows[bytes(key)] = row
+            self._free_rows = list(reversed(range(len(kept), self.max_entries)))
+            self._tick = int(saved[2].max()) if len(kept) else 0
+            return
+
+        self._vectors, self._keys, self._ticks = vectors, keys, ticks
+        for row in occupied:
+            self._rows[bytes(keys[row])] = row
+        occupied_rows = set(occupied)
+        self._free_rows = [row for row in reversed(range(len(keys))) if row not in occupied_rows]
+        self._tick = int(ticks.max()) if len(ticks) else 0
+
+    def _create(self, dim: int) -> None:
+        self._vectors = np.lib.format.open_memmap(
+            self._vectors_path, mode="w+", dtype=self.dtype, shape=(self.max_entries, dim)
+        )
+        self._keys = np.lib.format.open_memmap(
+            self._keys_path, mode="w+", dtype="S32", shape=(self.max_entries,)
+        )
+        self._ticks = np.lib.format.open_memmap(
+            self._ticks_path, mode="w+", dtype=np.int64, shape=(self.max_entries,)
+        )
+        self._rows.clear()
+        self._free_rows = list(reversed(range(self.max_entries)))
+
+def _flush_store(reference: "weakref.ref[EmbeddingStore]") -> None:
+    store = reference()
+    if store is not None:
+        store.flush()
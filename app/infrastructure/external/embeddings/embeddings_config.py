@@ -8,6 +8,10 @@ class EmbeddingsConfig(BaseSettings):
     cache_dir: Optional[str] = None
     max_length: int = 512
     batch_size: int = 32
+    store_dir: Optional[str] = None
+    store_max_entries: int = 100_000
+    store_memory_entries: int = 10_000
+    store_dtype: str = "float16"
 
     class Config:
         env_prefix = "EMBEDDINGS_"
\ No newline at end of file
@@ -0,0 +1,220 @@
+# infrastructure/external/llm/batching_llm.py
+from typing import Iterator, List, Optional, Dict, Tuple
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import logging
+import queue
+import threading
+import time
+from ....domain.ports.llm_port import LLMPort
+from ....domain.model.entities.generation import GeneratedResult, GenerationChunk
+from .instruct_model import InstructModel
+from .llm_config import LLMConfig
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class _PendingGeneration:
+    prompt: str
+    num_sequences: int
+    max_tokens: int
+    temperature: float
+    stop_sequences: Optional[List[str]]
+    prompt_prefix: Optional[str] = None
+    deadline: Optional[float] = None
+    future: Future = field(default_factory=Future)
+
+    def batch_key(self) -> Tuple[int, int, float]:
+        # Only requests sharing these settings can go through the same model.generate call
+        return (self.num_sequences, self.max_tokens, self.temperature)
+
+class BatchingLLM(LLMPort):
+    """Micro-batches concurrent generate calls into shared model.generate passes."""
+
+    def __init__(
+        self,
+        model: InstructModel,
+        max_batch_size: int = 4,
+        batch_window_ms: float = 10.0
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window_ms / 1000.0
+
+        self._queue: "queue.Queue[Optional[_PendingGeneration]]" = queue.Queue()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="llm-batcher", daemon=True)
+        self._worker.start()
+
+        logger.info(
+            f"Initialized BatchingLLM (max_batch_size={max_batch_size}, "
+            f"batch_window_ms={batch_window_ms})"
+        )
+
+    @classmethod
+    def from_config(cls, model: InstructModel, config: LLMConfig) -> "BatchingLLM":
+        return cls(
+            model=model,
+            max_batch_size=config.max_batch_size,
+            batch_window_ms=config.batch_window_ms
+        )
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        max_time: Optional[float] = None
+    ) -> List[GeneratedResult]:
+        if self._closed:
+            raise RuntimeError("BatchingLLM has been closed")
+
+        prompt = self.model.build_prompt(system_prompt, user_prompt)
+        pending = _PendingGeneration(
+            prompt=prompt,
+            num_sequences=num_sequences,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop_sequences=stop_sequences,
+            prompt_prefix=self.model.prompt_prefix(prompt, user_prompt),
+            deadline=time.monotonic() + max_time if max_time is not None else None
+        )
+        self._queue.put(pending)
+        return pending.future.result()
+
+    def generate_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        max_time: Optional[float] = None
+    ) -> List[List[GeneratedResult]]:
+        if self._closed:
+            raise RuntimeError("BatchingLLM has been closed")
+
+        deadline = time.monotonic() + max_time if max_time is not None else None
+
+        # Queue every prompt before waiting so the worker can pack them into full batches
+        pending = []
+        for system_prompt, user_prompt in prompts:
+            prompt = self.model.build_prompt(system_prompt, user_prompt)
+            item = _PendingGeneration(
+                prompt=prompt,
+                num_sequences=num_sequences,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stop_sequences=stop_sequences,
+                prompt_prefix=self.model.prompt_prefix(prompt, user_prompt),
+                deadline=deadline
+            )
+            self._queue.put(item)
+            pending.append(item)
+        return [item.future.result() for item in pending]
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None
+    ) -> Iterator[GenerationChunk]:
+        # Streams need their own decode loop, so they bypass the batch queue
+        return self.model.generate_stream(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            num_sequences=num_sequences,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop_sequences=stop_sequences
+        )
+
+    def score_next_token(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        candidates: List[str]
+    ) -> Dict[str, float]:
+        return self.model.score_next_token(system_prompt, user_prompt, candidates)
+
+    def score_next_token_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        candidates: List[str]
+    ) -> List[Dict[str, float]]:
+        return self.model.score_next_token_batch(prompts, candidates)
+
+    def get_token_count(self, text: str) -> int:
+        return self.model.get_token_count(text)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            pending = [first]
+            stop_requested = False
+            window_end = time.monotonic() + self.batch_window
+
+            # Keep collecting until the window closes or the batch is full
+            while len(pending) < self.max_batch_size:
+                remaining = window_end - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop_requested = True
+                    break
+                pending.append(item)
+
+            self._dispatch(pending)
+            if stop_requested:
+                return
+
+    def _dispatch(self, pending: List[_PendingGeneration]) -> None:
+        groups: Dict[Tuple[int, int, float], List[_PendingGeneration]] = {}
+        for item in pending:
+            groups.setdefault(item.batch_key(), []).append(item)
+
+        for (num_sequences, max_tokens, temperature), group in groups.items():
+            # The batch runs until its most urgent request has to be answered
+            deadlines = [item.deadline for item in group if item.deadline is not None]
+            max_time = min(deadlines) - time.monotonic() if deadlines else None
+            try:
+                results = self.model.generate_from_prompts(
+                    prompts=[item.prompt for item in group],
+                    num_sequences=num_sequences,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stop_sequences=[item.stop_sequences for item in group],
+                    prompt_prefixes=[item.prompt_prefix for item in group],
+                    max_time=max_time
+                )
+            except Exception as e:
+                logger.error(f"Error generating batch of {len(group)} prompts: {str(e)}")
+                for item in group:
+                    item.future.set_exception(e)
+                continue
+
+            for item, result in zip(group, results):
+                item.future.set_result(result)
@@ -1,12 +1,18 @@
 # infrastructure/external/llm/instruct_model.py
-from typing import List, Optional, Dict
+from typing import Any, Iterator, List, Optional, Dict, Tuple
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from transformers import AutoModelForCausalLM, AutoTokenizer, StoppingCriteriaList
 import logging
 import re
+import threading
+import time
 from datetime import datetime
 from ....domain.ports.llm_port import LLMPort
-from ....domain.model.entities.generation import GeneratedResult, GenerationMetadata
+from ....domain.model.entities.generation import GeneratedResult, GenerationMetadata, GenerationChunk
+from .prefix_cache import PrefixKVCache, PrefixCacheStats
+from .llm_config import LLMConfig
+from .token_streamer import SequenceStreamer
+from .stopping_criteria import StopSequenceCriteria, CancellationCriteria
 
 logger = logging.getLogger(__name__)
 
@@ -16,23 +22,46 @@ class InstructModel(LLMPort):
         model_name: str = "EleutherAI/gpt-neo-125M",
         device: Optional[str] = None,
         cache_dir: Optional[str] = None,
-        max_length: int = 2048
+        max_length: int = 2048,
+        prefix_cache: Optional[PrefixKVCache] = None,
+        max_batch_size: int = 4
     ):
         self.model_name = model_name
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
         self.cache_dir = cache_dir
         self.max_length = max_length
         self.instruct_mode = "instruct" in model_name.lower()
+        self.prefix_cache = prefix_cache
+        self.max_batch_size = max_batch_size
+        self._candidate_token_ids: Dict[str, List[int]] = {}
         
         logger.info(f"Initializing InstructModel with {model_name} on {self.device}")
         try:
             self.tokenizer = AutoTokenizer.from_pretrained(model_name, cache_dir=cache_dir)
+            # Left padding keeps every prompt adjacent to its generated tokens when batching
+            self.tokenizer.padding_side = "left"
+            if self.tokenizer.pad_token is None:
+                self.tokenizer.pad_token = self.tokenizer.eos_token
             self.model = AutoModelForCausalLM.from_pretrained(model_name, cache_dir=cache_dir)
             self.model.to(self.device)
         except Exception as e:
             logger.error(f"Error initializing LLM model: {str(e)}")
             raise
 
+    @classmethod
+    def from_config(cls, config: LLMConfig) -> "InstructModel":
+        return cls(
+            model_name=config.model_name,
+            device=config.device,
+            cache_dir=config.cache_dir,
+            max_length=config.max_length,
+            prefix_cache=PrefixKVCache(
+                max_bytes=config.prefix_cache_max_bytes,
+                min_occurrences=config.prefix_cache_min_occurrences
+            ),
+            max_batch_size=config.max_batch_size
+        )
+
     def generate(
         self,
         system_prompt: str,
@@ -40,43 +69,113 @@ class InstructModel(LLMPort):
         num_sequences: int = 1,
         max_tokens: int = 100,
         temperature: float = 1.0,
-        stop_sequences: Optional[List[str]] = None
+        stop_sequences: Optional[List[str]] = None,
+        max_time: Optional[float] = None
     ) -> List[GeneratedResult]:
+        prompt = self.build_prompt(system_prompt, user_prompt)
+        return self.generate_from_prompts(
+            prompts=[prompt],
+            num_sequences=num_sequences,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop_sequences=[stop_sequences],
+            prompt_prefixes=[self.prompt_prefix(prompt, user_prompt)],
+            max_time=max_time
+        )[0]
+
+    def generate_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None,
+        max_time: Optional[float] = None
+    ) -> List[List[GeneratedResult]]:
+        deadline = time.monotonic() + max_time if max_time is not None else None
+        built_prompts = [self.build_prompt(system_prompt, user_prompt) for system_prompt, user_prompt in prompts]
+        prefixes = [
+            self.prompt_prefix(prompt, user_prompt)
+            for prompt, (_, user_prompt) in zip(built_prompts, prompts)
+        ]
+
+        results: List[List[GeneratedResult]] = []
+        for start in range(0, len(built_prompts), self.max_batch_size):
+            chunk = built_prompts[start:start + self.max_batch_size]
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                # Out of time: prompts not reached get no sequences
+                results.extend([] for _ in chunk)
+                continue
+            results.extend(self.generate_from_prompts(
+                prompts=chunk,
+                num_sequences=num_sequences,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stop_sequences=[stop_sequences] * len(chunk),
+                prompt_prefixes=prefixes[start:start + self.max_batch_size],
+                max_time=remaining
+            ))
+        return results
+
+    def generate_from_prompts(
+        self,
+        prompts: List[str],
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[Optional[List[str]]]] = None,
+        prompt_prefixes: Optional[List[Optional[str]]] = None,
+        max_time: Optional[float] = None
+    ) -> List[List[GeneratedResult]]:
         start_time = datetime.now()
-        
-        try:
-            # Prepare input based on model type
-            if self.instruct_mode:
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ]
-                prompt = self.tokenizer.apply_chat_template(
-                    messages,
-                    tokenize=False,
-                    add_generation_prompt=True
-                )
-            else:
-                prompt = f"{system_prompt}\n{user_prompt}"
+        stop_sequences = stop_sequences or [None] * len(prompts)
 
-            # Tokenize input
+        try:
+            # Tokenize all prompts together, left-padded to a common length
             inputs = self.tokenizer(
-                [prompt],
+                prompts,
                 return_tensors="pt",
                 padding=True,
                 truncation=True,
                 max_length=self.max_length - max_tokens
             ).to(self.device)
 
-            # Generate responses
+            generation_kwargs = dict(inputs)
+            # Cached prefixes only line up with unpadded input: a single prompt, or a batch
+            # whose prompts share the prefix and tokenize to the same length. Padded
+            # batches would need the padding between prefix and suffix, so they prefill in full
+            if (
+                self.prefix_cache is not None
+                and prompt_prefixes
+                and prompt_prefixes[0]
+                and all(prefix == prompt_prefixes[0] for prefix in prompt_prefixes)
+                and bool(inputs["attention_mask"].all())
+            ):
+                past_key_values = self._cached_prefix_state(
+                    inputs["input_ids"], prompt_prefixes[0], num_sequences
+                )
+                if past_key_values is not None:
+                    generation_kwargs["past_key_values"] = past_key_values
+
+            stopping_criteria = self._stopping_criteria(
+                inputs["input_ids"].shape[1],
+                [stops for stops in stop_sequences for _ in range(num_sequences)]
+            )
+            if stopping_criteria is not None:
+                generation_kwargs["stopping_criteria"] = stopping_criteria
+            if max_time is not None:
+                # Stops decoding on wall-clock time, keeping the tokens produced so far
+                generation_kwargs["max_time"] = max(max_time, 0.0)
+
+            # Generate responses for the whole batch in a single call
             outputs = self.model.generate(
-                **inputs,
+                **generation_kwargs,
                 max_new_tokens=max_tokens,
                 num_return_sequences=num_sequences,
                 do_sample=True,
                 temperature=temperature,
-                pad_token_id=self.tokenizer.eos_token_id,
-                attention_mask=inputs['attention_mask']
+                pad_token_id=self.tokenizer.pad_token_id
             )
 
             # Decode outputs
@@ -85,35 +184,183 @@ class InstructModel(LLMPort):
                 skip_special_tokens=True
             )
 
-            # Process outputs
-            results = []
-            for output in decoded_outputs:
-                content = self._extract_assistant_response(output) if self.instruct_mode else output
-                
-                # Apply stop sequences if provided
-                if stop_sequences:
-                    for stop_seq in stop_sequences:
-                        if stop_seq in content:
-                            content = content[:content.index(stop_seq)]
-
-                # Create generation metadata
-                metadata = GenerationMetadata(
-                    model_name=self.model_name,
-                    tokens_used=len(self.tokenizer.encode(content)),
-                    generation_time=(datetime.now() - start_time).total_seconds()
+            # Outputs are grouped per prompt: rows [i * n, (i + 1) * n) belong to prompt i
+            results: List[List[GeneratedResult]] = [[] for _ in prompts]
+            for row, output in enumerate(decoded_outputs):
+                prompt_index = row // num_sequences
+                results[prompt_index].append(
+                    self._build_result(output, stop_sequences[prompt_index], start_time)
                 )
 
-                results.append(GeneratedResult(
-                    content=content.strip(),
-                    metadata=metadata
-                ))
-
             return results
 
         except Exception as e:
             logger.error(f"Error generating text: {str(e)}")
             raise
 
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        num_sequences: int = 1,
+        max_tokens: int = 100,
+        temperature: float = 1.0,
+        stop_sequences: Optional[List[str]] = None
+    ) -> Iterator[GenerationChunk]:
+        start_time = datetime.now()
+
+        try:
+            inputs = self.tokenizer(
+                [self.build_prompt(system_prompt, user_prompt)],
+                return_tensors="pt",
+                truncation=True,
+                max_length=self.max_length - max_tokens
+            ).to(self.device)
+        except Exception as e:
+            logger.error(f"Error generating text stream: {str(e)}")
+            raise
+
+        streamer = SequenceStreamer(self.tokenizer, num_sequences)
+        generation_kwargs = dict(
+            inputs,
+            max_new_tokens=max_tokens,
+            num_return_sequences=num_sequences,
+            do_sample=True,
+            temperature=temperature,
+            pad_token_id=self.tokenizer.pad_token_id,
+            streamer=streamer
+        )
+        # Set when the consumer stops iterating, so decoding ends at the next token
+        cancelled = threading.Event()
+        stopping_criteria = self._stopping_criteria(
+            inputs["input_ids"].shape[1],
+            [stop_sequences] * num_sequences
+        ) or StoppingCriteriaList()
+        stopping_criteria.append(CancellationCriteria(cancelled))
+        generation_kwargs["stopping_criteria"] = stopping_criteria
+        lead = self._stream_lead(inputs["input_ids"][0])
+
+        def _decode() -> None:
+            try:
+                with torch.no_grad():
+                    self.model.generate(**generation_kwargs)
+            except Exception as e:
+                logger.error(f"Error generating text stream: {str(e)}")
+                streamer.fail(e)
+
+        # Decoding runs in the background so chunks reach the caller as they are produced
+        thread = threading.Thread(target=_decode, name="llm-stream", daemon=True)
+        thread.start()
+
+        # Texts are post-processed like generate(): the assistant turn only, stripped
+        texts = [lead] * num_sequences
+        emitted = [0] * num_sequences
+        finished = [False] * num_sequences
+        first_token_times: List[Optional[float]] = [None] * num_sequences
+
+        try:
+            for index, delta in streamer:
+                if finished[index]:
+                    continue
+                if first_token_times[index] is None:
+                    first_token_times[index] = (datetime.now() - start_time).total_seconds()
+
+                texts[index] = (texts[index] + delta).lstrip()
+                chunk, finished[index] = self._stream_delta(texts[index], emitted[index], stop_sequences)
+                if finished[index]:
+                    texts[index] = texts[index][:emitted[index] + len(chunk)]
+                # Trailing whitespace is held back until text follows it, as the result is stripped
+                chunk = chunk.rstrip()
+                if chunk:
+                    emitted[index] += len(chunk)
+                    yield GenerationChunk(sequence_index=index, text=chunk)
+
+            thread.join()
+            generation_time = (datetime.now() - start_time).total_seconds()
+
+            for index in range(num_sequences):
+                # Flush whatever was held back while waiting for a possible stop sequence
+                texts[index] = texts[index].rstrip()
+                remainder = texts[index][emitted[index]:]
+                yield GenerationChunk(
+                    sequence_index=index,
+                    text=remainder,
+                    is_final=True,
+                    metadata=GenerationMetadata(
+                        model_name=self.model_name,
+                        tokens_used=len(self.tokenizer.encode(texts[index])),
+                        generation_time=generation_time,
+                        time_to_first_token=first_token_times[index]
+                    )
+                )
+        finally:
+            # Also reached when the consumer closes the stream early
+            cancelled.set()
+
+    def score_next_token(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        candidates: List[str]
+    ) -> Dict[str, float]:
+        try:
+            inputs = self.tokenizer(
+                [self.build_prompt(system_prompt, user_prompt)],
+                return_tensors="pt",
+                truncation=True,
+                max_length=self.max_length
+            ).to(self.device)
+
+            # One forward pass over the prompt; only the next-token distribution is needed
+            with torch.no_grad():
+                logits = self.model(**inputs).logits[0, -1]
+            probabilities = torch.softmax(logits.float(), dim=-1)
+
+            return {
+                candidate: probabilities[self._token_ids_for_candidate(candidate)].sum().item()
+                for candidate in candidates
+            }
+        except Exception as e:
+            logger.error(f"Error scoring next token: {str(e)}")
+            raise
+
+    def score_next_token_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        candidates: List[str]
+    ) -> List[Dict[str, float]]:
+        results: List[Dict[str, float]] = []
+        try:
+            built_prompts = [self.build_prompt(system_prompt, user_prompt) for system_prompt, user_prompt in prompts]
+            candidate_ids = {candidate: self._token_ids_for_candidate(candidate) for candidate in candidates}
+
+            for start in range(0, len(built_prompts), self.max_batch_size):
+                inputs = self.tokenizer(
+                    built_prompts[start:start + self.max_batch_size],
+                    return_tensors="pt",
+                    padding=True,
+                    truncation=True,
+                    max_length=self.max_length
+                ).to(self.device)
+
+                # Prompts are left-padded, so the last position is the next token for every row.
+                # Positions count from each row's first real token, as for an unpadded prompt
+                position_ids = (inputs["attention_mask"].cumsum(-1) - 1).clamp(min=0)
+                with torch.no_grad():
+                    logits = self.model(**inputs, position_ids=position_ids).logits[:, -1]
+                probabilities = torch.softmax(logits.float(), dim=-1)
+
+                for row in probabilities:
+                    results.append({
+                        candidate: row[token_ids].sum().item()
+                        for candidate, token_ids in candidate_ids.items()
+                    })
+
+            return results
+        except Exception as e:
+            logger.error(f"Error scoring next token batch: {str(e)}")
+            raise
+
     def get_token_count(self, text: str) -> int:
         try:
             return len(self.tokenizer.encode(text))
@@ -121,6 +368,145 @@ class InstructModel(LLMPort):
             logger.error(f"Error counting tokens: {str(e)}")
             raise
 
+    def prefix_cache_stats(self) -> Optional[PrefixCacheStats]:
+        if self.prefix_cache is None:
+            return None
+        return self.prefix_cache.stats()
+
+    def build_prompt(self, system_prompt: str, user_prompt: str) -> str:
+        # Prepare input based on model type
+        if self.instruct_mode:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ]
+            return self.tokenizer.apply_chat_template(
+                messages,
+                tokenize=False,
+                add_generation_prompt=True
+            )
+        return f"{system_prompt}\n{user_prompt}"
+
+    def prompt_prefix(self, prompt: str, user_prompt: str) -> Optional[str]:
+        # Everything before the user prompt (template header and system prompt) is shared
+        # by every call that reuses the same system prompt
+        index = prompt.rfind(user_prompt) if user_prompt else -1
+        if index <= 0:
+            return None
+        return prompt[:index]
+
+    def _cached_prefix_state(
+        self,
+        input_ids: torch.Tensor,
+        prefix: str,
+        num_sequences: int
+    ) -> Optional[Any]:
+        prefix_ids = self.tokenizer(prefix)["input_ids"]
+
+        # The prefix must tokenize identically inside the full prompt and leave
+        # at least one suffix token to prefill
+        if (
+            not prefix_ids
+            or len(prefix_ids) >= input_ids.shape[1]
+            or any(row[:len(prefix_ids)].tolist() != prefix_ids for row in input_ids)
+        ):
+            return None
+
+        past_key_values = self.prefix_cache.lookup(prefix_ids)
+        if past_key_values is None:
+            if not self.prefix_cache.should_admit(prefix_ids):
+                return None
+            with torch.no_grad():
+                past_key_values = self.model(
+                    input_ids=input_ids[:1, :len(prefix_ids)],
+                    use_cache=True
+                ).past_key_values
+            self.prefix_cache.store(prefix_ids, past_key_values)
+
+        # Every row starts with the same prefix, so one cached row serves them all
+        return PrefixKVCache.prepare_for_generation(past_key_values, input_ids.shape[0] * num_sequences)
+
+    def _token_ids_for_candidate(self, candidate: str) -> List[int]:
+        # Answers may start with any casing and with or without a leading space;
+        # the first token of each variant counts towards the candidate
+        if candidate not in self._candidate_token_ids:
+            token_ids = set()
+            for variant in {candidate, candidate.lower(), candidate.capitalize(), candidate.upper()}:
+                for text in (variant, f" {variant}"):
+                    encoded = self.tokenizer.encode(text, add_special_tokens=False)
+                    if encoded:
+                        token_ids.add(encoded[0])
+            self._candidate_token_ids[candidate] = sorted(token_ids)
+        return self._candidate_token_ids[candidate]
+
+    def _stopping_criteria(
+        self,
+        prompt_length: int,
+        stop_sequences: List[Optional[List[str]]]
+    ) -> Optional[StoppingCriteriaList]:
+        # Rows stop decoding as soon as their stop sequence shows up; the call
+        # returns once every row has stopped or hit EOS
+        if not any(stop_sequences):
+            return None
+        return StoppingCriteriaList([
+            StopSequenceCriteria(self.tokenizer, prompt_length, stop_sequences)
+        ])
+
+    def _stream_lead(self, prompt_ids: torch.Tensor) -> str:
+        # generate() keeps what follows the assistant marker in the decoded prompt and
+        # output; when the prompt holds the marker, that starts with the prompt's tail
+        if not self.instruct_mode:
+            return ""
+        prompt_text = self.tokenizer.decode(prompt_ids, skip_special_tokens=True)
+        match = re.search(r"(?:assistant|Assistant):\s*(.*)", prompt_text, re.DOTALL | re.IGNORECASE)
+        return match.group(1) if match else ""
+
+    def _stream_delta(
+        self,
+        text: str,
+        emitted: int,
+        stop_sequences: Optional[List[str]]
+    ) -> Tuple[str, bool]:
+        if not stop_sequences:
+            return text[emitted:], False
+
+        longest = max(len(stop_seq) for stop_seq in stop_sequences)
+        search_from = max(0, emitted - longest + 1)
+        stops = [text.find(stop_seq, search_from) for stop_seq in stop_sequences]
+        stops = [index for index in stops if index != -1]
+        if stops:
+            return text[emitted:min(stops)], True
+
+        # Hold back a tail that could still grow into a stop sequence
+        safe_end = max(emitted, len(text) - longest + 1)
+        return text[emitted:safe_end], False
+
+    def _build_result(
+        self,
+        output: str,
+        stop_sequences: Optional[List[str]],
+        start_time: datetime
+    ) -> GeneratedResult:
+        content = self._extract_assistant_response(output) if self.instruct_mode else output
+
+        # Apply stop sequences if provided
+        if stop_sequences:
+            for stop_seq in stop_sequences:
+                if stop_seq in content:
+                    content = content[:content.index(stop_seq)]
+
+        # Create generation metadata
+        metadata = GenerationMetadata(
+            model_name=self.model_name,
+            tokens_used=len(self.tokenizer.encode(content)),
+            generation_time=(datetime.now() - start_time).total_seconds()
+        )
+
+        return GeneratedResult(
+            content=content.strip(),
+            metadata=metadata
+        )
+
     def _extract_assistant_response(self, text: str) -> str:
         # Extract content after "assistant" or "Assistant:"
         match = re.search(r"(?:assistant|Assistant):\s*(.*)", text, re.DOTALL | re.IGNORECASE)
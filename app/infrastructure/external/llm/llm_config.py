@@ -1,3 +1,7 @@
+# infrastructure/external/llm/llm_config.py
+from typing import Optional
+from pydantic import BaseSettings
+
 class LLMConfig(BaseSettings):
     model_name: str = "EleutherAI/gpt-neo-125M"
     device: Optional[str] = None
@@ -5,6 +9,9 @@ class LLMConfig(BaseSettings):
     max_length: int = 2048
     default_temperature: float = 1.0
     max_batch_size: int = 4
+    batch_window_ms: float = 10.0
+    prefix_cache_max_bytes: int = 256 * 1024 * 1024
+    prefix_cache_min_occurrences: int = 2
 
     class Config:
-        env_prefix = "LLM_"
\ No newline at end of file
+        env_prefix = "LLM_"
@@ -0,0 +1,139 @@
+# infrastructure/external/llm/prefix_cache.py
+from typing import Any, Iterator, Optional, Sequence, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+import copy
+import logging
+import threading
+import torch
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class PrefixCacheStats:
+    hits: int
+    misses: int
+    admissions: int
+    evictions: int
+    saved_prefill_tokens: int
+    entries: int
+    bytes_used: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+class PrefixKVCache:
+    """LRU store of past_key_values for prompt prefixes, bounded by a memory budget."""
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        min_occurrences: int = 2,
+        max_tracked_prefixes: int = 4096
+    ):
+        self.max_bytes = max_bytes
+        self.min_occurrences = min_occurrences
+        self.max_tracked_prefixes = max_tracked_prefixes
+
+        self._entries: "OrderedDict[Tuple[int, ...], Tuple[Any, int]]" = OrderedDict()
+        self._sightings: "OrderedDict[Tuple[int, ...], int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._bytes_used = 0
+        self._hits = 0
+        self._misses = 0
+        self._admissions = 0
+        self._evictions = 0
+        self._saved_prefill_tokens = 0
+
+    def lookup(self, prefix_ids: Sequence[int]) -> Optional[Any]:
+        key = tuple(prefix_ids)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            self._saved_prefill_tokens += len(key)
+            return entry[0]
+
+    def should_admit(self, prefix_ids: Sequence[int]) -> bool:
+        # Only prefixes seen repeatedly are worth the extra prefill pass and memory
+        key = tuple(prefix_ids)
+        with self._lock:
+            count = self._sightings.pop(key, 0) + 1
+            self._sightings[key] = count
+            while len(self._sightings) > self.max_tracked_prefixes:
+                self._sightings.popitem(last=False)
+            return count >= self.min_occurrences
+
+    def store(self, prefix_ids: Sequence[int], past_key_values: Any) -> bool:
+        key = tuple(prefix_ids)
+        size = _past_nbytes(past_key_values)
+        if size > self.max_bytes:
+            logger.debug(f"Prefix of {len(key)} tokens exceeds the cache budget ({size} bytes)")
+            return False
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes_used -= previous[1]
+
+            while self._entries and self._bytes_used + size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes_used -= evicted_size
+                self._evictions += 1
+
+            self._entries[key] = (past_key_values, size)
+            self._bytes_used += size
+            self._sightings.pop(key, None)
+            self._admissions += 1
+            return True
+
+    def stats(self) -> PrefixCacheStats:
+        with self._lock:
+            return PrefixCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                admissions=self._admissions,
+                evictions=self._evictions,
+                saved_prefill_tokens=self._saved_prefill_tokens,
+                entries=len(self._entries),
+                bytes_used=self._bytes_used
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sightings.clear()
+            self._bytes_used = 0
+
+    @staticmethod
+    def prepare_for_generation(past_key_values: Any, rows: int) -> Any:
+        # generate() extends the cache in place, so every call works on its own copy,
+        # expanded to one row per generated sequence
+        past = copy.deepcopy(past_key_values)
+        if rows == 1:
+            return past
+        if hasattr(past, "batch_repeat_interleave"):
+            past.batch_repeat_interleave(rows)
+            return past
+        return tuple(
+            tuple(tensor.repeat_interleave(rows, dim=0) for tensor in layer)
+            for layer in past
+        )
+
+def _iter_past_tensors(past_key_values: Any) -> Iterator[torch.Tensor]:
+    if hasattr(past_key_values, "to_legacy_cache"):
+        past_key_values = past_key_values.to_legacy_cache()
+    for layer in past_key_values:
+        for tensor in layer:
+            yield tensor
+
+def _past_nbytes(past_key_values: Any) -> int:
+    return sum(t.element_size() * t.nelement() for t in _iter_past_tensors(past_key_values))
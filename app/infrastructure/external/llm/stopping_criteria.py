@@ -0,0 +1,51 @@
+# infrastructure/external/llm/stopping_criteria.py
+from typing import List, Optional
+import threading
+import torch
+from transformers import StoppingCriteria
+
+class StopSequenceCriteria(StoppingCriteria):
+    """Marks each generated row as finished once its own stop sequences appear."""
+
+    def __init__(
+        self,
+        tokenizer,
+        prompt_length: int,
+        stop_sequences: List[Optional[List[str]]]
+    ):
+        self.tokenizer = tokenizer
+        self.prompt_length = prompt_length
+        self.stop_sequences = stop_sequences
+        # Every token covers at least one byte, so this many trailing tokens always
+        # contain a complete stop sequence that has just been produced
+        self.windows = [
+            max(len(stop_seq.encode("utf-8")) for stop_seq in stops) + 1 if stops else 0
+            for stops in stop_sequences
+        ]
+        self._finished: Optional[torch.Tensor] = None
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        if self._finished is None:
+            self._finished = torch.zeros(input_ids.shape[0], dtype=torch.bool, device=input_ids.device)
+
+        length = input_ids.shape[1]
+        for row, stops in enumerate(self.stop_sequences):
+            if not stops or self._finished[row]:
+                continue
+            start = max(self.prompt_length, length - self.windows[row])
+            tail = self.tokenizer.decode(input_ids[row, start:], skip_special_tokens=True)
+            if any(stop_seq in tail for stop_seq in stops):
+                self._finished[row] = True
+
+        return self._finished.clone()
+
+class CancellationCriteria(StoppingCriteria):
+    """Stops every row once the event is set, e.g. when a stream's consumer goes away."""
+
+    def __init__(self, cancelled: threading.Event):
+        self.cancelled = cancelled
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        return torch.full(
+            (input_ids.shape[0],), self.cancelled.is_set(), dtype=torch.bool, device=input_ids.device
+        )
@@ -0,0 +1,62 @@
+# infrastructure/external/llm/token_streamer.py
+from typing import Iterator, List, Optional, Tuple, Union
+import queue
+from transformers.generation.streamers import BaseStreamer
+
+class SequenceStreamer(BaseStreamer):
+    """Token streamer that decodes every returned sequence of a generate call separately."""
+
+    def __init__(self, tokenizer, num_sequences: int, timeout: Optional[float] = None):
+        self.tokenizer = tokenizer
+        self.num_sequences = num_sequences
+        self.timeout = timeout
+
+        self._queue: "queue.Queue[Union[Tuple[int, str], Exception, None]]" = queue.Queue()
+        self._prompt_seen = False
+        self._tokens: List[List[int]] = [[] for _ in range(num_sequences)]
+        self._emitted: List[int] = [0] * num_sequences
+
+    def put(self, value) -> None:
+        # The first call carries the prompt ids, which are not part of the output
+        if not self._prompt_seen:
+            self._prompt_seen = True
+            return
+
+        for index, token_id in enumerate(value.reshape(-1).tolist()):
+            self._tokens[index].append(token_id)
+            self._flush(index, final=False)
+
+    def end(self) -> None:
+        for index in range(self.num_sequences):
+            self._flush(index, final=True)
+        self._queue.put(None)
+
+    def fail(self, error: Exception) -> None:
+        self._queue.put(error)
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        while True:
+            item = self._queue.get(timeout=self.timeout)
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def _flush(self, index: int, final: bool) -> None:
+        text = self.tokenizer.decode(self._tokens[index], skip_special_tokens=True)
+
+        # Hold back incomplete multi-byte characters until the next token completes them
+        if not final and text.endswith("\ufffd"):
+            return
+
+        delta = text[self._emitted[index]:]
+        if delta:
+            self._queue.put((index, delta))
+
+        # Restart decoding after each line so the decoded window stays short
+        if text.endswith("\n"):
+            self._tokens[index] = []
+            self._emitted[index] = 0
+        else:
+            self._emitted[index] = len(text)
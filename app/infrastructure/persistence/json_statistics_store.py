@@ -0,0 +1,105 @@
+# infrastructure/persistence/json_statistics_store.py
+from typing import Dict, List, Optional
+from dataclasses import asdict
+from functools import partial
+from pathlib import Path
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from ...domain.ports.statistics_port import MethodStatisticsPort
+from ...domain.model.entities.method_statistics import MethodStatistics
+from ...domain.model.entities.verification import VerificationMethodType
+
+logger = logging.getLogger(__name__)
+
+class JsonMethodStatisticsStore(MethodStatisticsPort):
+    """Keeps method statistics in a JSON file, rewriting it every few updates.
+
+    Buffered updates are also written once flush_interval seconds have passed since
+    the last write, on close and at interpreter exit.
+    """
+
+    def __init__(self, path: str, write_interval: int = 20, flush_interval: Optional[float] = 30.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.write_interval = max(write_interval, 1)
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._statistics: Dict[str, MethodStatistics] = {}
+        self._pending_writes = 0
+        self._last_write = time.monotonic()
+
+        self._read()
+        # Held weakly, so the hook does not keep an abandoned store alive
+        self._exit_hook = partial(_flush_store, weakref.ref(self))
+        atexit.register(self._exit_hook)
+        logger.info(f"Loaded statistics for {len(self._statistics)} verification methods from {path}")
+
+    def load(self) -> List[MethodStatistics]:
+        with self._lock:
+            return list(self._statistics.values())
+
+    def save(self, statistics: List[MethodStatistics]) -> None:
+        with self._lock:
+            for entry in statistics:
+                self._statistics[entry.method_key] = entry
+            self._pending_writes += 1
+            overdue = (
+                self.flush_interval is not None
+                and time.monotonic() - self._last_write >= self.flush_interval
+            )
+            if self._pending_writes >= self.write_interval or overdue:
+                self._write()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending_writes:
+                self._write()
+
+    def close(self) -> None:
+        atexit.unregister(self._exit_hook)
+        self.flush()
+
+    def _read(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            for entry in entries:
+                entry["method_type"] = VerificationMethodType(entry["method_type"])
+                statistics = MethodStatistics(**entry)
+                self._statistics[statistics.method_key] = statistics
+        except Exception as e:
+            # Statistics only guide ordering, so a damaged file is not fatal
+            logger.warning(f"Ignoring unreadable statistics file {self.path}: {str(e)}")
+            self._statistics = {}
+
+    def _write(self) -> None:
+        entries = []
+        for statistics in self._statistics.values():
+            entry = asdict(statistics)
+            entry["method_type"] = statistics.method_type.value
+            entries.append(entry)
+
+        # Write to a temporary file first so a crash never leaves a truncated file
+        temporary_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(temporary_path, self.path)
+            self._pending_writes = 0
+            self._last_write = time.monotonic()
+        except Exception as e:
+            logger.error(f"Error writing statistics to {self.path}: {str(e)}")
+            raise
+
+def _flush_store(reference: "weakref.ref[JsonMethodStatisticsStore]") -> None:
+    store = reference()
+    if store is not None:
+        store.flush()
@@ -0,0 +1,35 @@
+# tests/domain/services/test_regex_guard.py
+import pytest
+
+from app.domain.services.regex_guard import find_catastrophic_construct
+
+@pytest.mark.parametrize("pattern", [
+    r"(a+)+$",
+    r"(\w+\s?)*$",
+    r"(x+x+)+y",
+    r"(?:a+|b)+c",
+    r"(a|aa)+$",
+    r"(a|ab)*c",
+    r"^(a|a?)+$",
+    r"(.*a){20}",
+    r"(.*a){1,}",
+    r"(a?){25}a{25}",
+])
+def test_flags_ambiguous_repetitions(pattern):
+    assert find_catastrophic_construct(pattern) is not None
+
+@pytest.mark.parametrize("pattern", [
+    r"(\d+,)*\d+",
+    r"(a|b)+",
+    r"[a-z]+@[a-z]+\.com",
+    r"(?:\d+\.)+\d+",
+    r"(\d{1,3}\.){3}\d{1,3}",
+    r"(?:cat|mouse)+",
+    r"(\s*,\s*\w+)*",
+    r"(?:[^\"\\]|\\.)*",
+])
+def test_accepts_unambiguous_repetitions(pattern):
+    assert find_catastrophic_construct(pattern) is None
+
+def test_ignores_invalid_patterns():
+    assert find_catastrophic_construct(r"(a+") is None
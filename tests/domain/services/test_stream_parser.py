@@ -0,0 +1,32 @@
+# tests/domain/services/test_stream_parser.py
+from app.domain.model.entities.parsing import ParseRule, ParseMode, ParseScope, ParseStrategy
+from app.domain.services.parse_service import ParseService
+from app.domain.services.stream_parser import StreamParser
+
+def _spans(matches):
+    return sorted((match.rule_name, match.value, match.location.start, match.location.end) for match in matches)
+
+def test_keyword_value_waits_for_its_end_marker():
+    text = "head key:" + "v" * 500 + ";tail key:last"
+    rule = ParseRule("key", "key:", ParseMode.KEYWORD, strategy=ParseStrategy.ALL_MATCHES, secondary_pattern=";")
+    chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+
+    streamed = ParseService().parse_stream(chunks, [rule], chunk_size=16, overlap=8)
+
+    assert _spans(streamed) == _spans(ParseService().parse_text(text, [rule]).matches)
+
+def test_line_without_breaks_is_matched_in_bounded_pieces():
+    rule = ParseRule("digits", r"\d+", ParseMode.REGEX, ParseScope.LINE_BY_LINE, ParseStrategy.ALL_MATCHES)
+    parser = StreamParser([rule], chunk_size=100, overlap=10, max_line_length=300)
+    read = []
+
+    def chunks():
+        for _ in range(200):
+            read.append(len(read))
+            yield "x" * 95 + "12345"
+
+    matches = parser.parse(chunks())
+    first = next(matches)
+    assert len(read) <= 5
+    assert first.value == "12345"
+    assert {match.location.line_number for match in matches} == {1}